@@ -1,7 +1,58 @@
 """ Common utilities for cuso example scripts
 """
 
-from sage.all import random_prime, set_random_seed, randrange, gcd, inverse_mod
+from gmpy2 import gcd, invert, mpz, mpz_urandomb, next_prime, powmod, random_state
+from sage.all import set_random_seed, randrange
+
+
+def batch_inverse(values, modulus):
+    """Invert several values modulo the same modulus using Montgomery's trick
+
+    Only a single modular inversion is performed; the remaining inverses are
+    recovered from prefix products.
+
+    Args:
+        values (list): values to invert, each coprime to the modulus
+        modulus (int): modulus
+
+    Returns:
+        list: inverses of the values modulo modulus, as ints
+    """
+    modulus = mpz(int(modulus))
+    prefix_products = []
+    acc = mpz(1)
+    for value in values:
+        acc = acc * value % modulus
+        prefix_products.append(acc)
+    if not prefix_products:
+        return []
+
+    inv = invert(acc, modulus)
+    inverses = [None] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        inverses[i] = int(inv * prefix_products[i - 1] % modulus)
+        inv = inv * values[i] % modulus
+    inverses[0] = int(inv)
+    return inverses
+
+
+def rsa_encrypt(pt, e, n):
+    """Compute pt**e mod n
+
+    The common public exponent e = 3 is computed with two modular multiplications.
+
+    Args:
+        pt (int): plaintext
+        e (int): public exponent
+        n (int): RSA modulus
+
+    Returns:
+        int: ciphertext
+    """
+    pt = mpz(pt)
+    if e == 3:
+        return int((pt * pt % n) * pt % n)
+    return int(powmod(pt, e, n))
 
 
 def generate_rsa_key(bit_length, e_value=None, e_len=None, d_len=None, seed=None):
@@ -23,10 +74,11 @@ def generate_rsa_key(bit_length, e_value=None, e_len=None, d_len=None, seed=None
     if seed is not None:
         set_random_seed(seed)
 
-    p_lbound = 3 << (p_len - 2)
-    p_ubound = 1 << p_len
-    q_lbound = 3 << (q_len - 2)
-    q_ubound = 1 << q_len
+    # Seed GMP's generator from Sage's, so that seeded keys are reproducible
+    state = random_state(int(randrange(1 << 64)))
+    # Candidates have their top two bits set
+    p_top = mpz(3) << (p_len - 2)
+    q_top = mpz(3) << (q_len - 2)
 
     # Check exponent specification
     if e_value is not None:
@@ -36,6 +88,7 @@ def generate_rsa_key(bit_length, e_value=None, e_len=None, d_len=None, seed=None
     elif d_len is not None:
         assert e_len is None and e_value is None
 
+    # An even exponent is never coprime to p - 1, so pick another one
     while True:
         if e_value is not None:
             e = e_value
@@ -46,27 +99,33 @@ def generate_rsa_key(bit_length, e_value=None, e_len=None, d_len=None, seed=None
             e = randrange(1 << (d_len - 1), 1 << d_len)
         else:
             e = 3
+        e = mpz(int(e))
+        if e % 2 == 1:
+            break
 
-        p = int(random_prime(p_ubound, proof=False, lbound=p_lbound))
-        q = int(random_prime(q_ubound, proof=False, lbound=q_lbound))
+    # Generate p and q independently, so that rejecting one prime does not
+    # throw away the other
+    while True:
+        p = next_prime(mpz_urandomb(state, p_len) | p_top)
+        if p.bit_length() == p_len and gcd(e, p - 1) == 1:
+            break
 
+    while True:
+        q = next_prime(mpz_urandomb(state, q_len) | q_top)
         n = p * q
-
         if (
-            p.bit_length() == p_len
-            and q.bit_length() == q_len
+            q.bit_length() == q_len
             and n.bit_length() == bit_length
-            and gcd(e, p - 1) == 1
             and gcd(e, q - 1) == 1
         ):
             break
 
     phi = (p - 1) * (q - 1)
-    d = int(inverse_mod(e, phi))
+    d = invert(e, phi)
     if d_len is not None:
         # Swap d and e
         d, e = e, d
 
-    pub = (n, e)
-    priv = (p, q, d)
+    pub = (int(n), int(e))
+    priv = (int(p), int(q), int(d))
     return priv, pub
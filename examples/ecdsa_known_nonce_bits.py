@@ -3,29 +3,45 @@ import logging
 import math
 import os
 
-from sage.all import var, inverse_mod
+from sage.all import PolynomialRing, ZZ
 import ecdsa
 from ecdsa.util import PRNG, sigdecode_string
 from ecdsa.keys import _truncate_and_convert_digest
 
+import common
 import cuso
 
 
-def get_rsh(vk, msg: bytes, sig: bytes):
-    """Recover the values of r, and s, and h from a message and signature pair.
+def get_rsh_batch(vk, msgs, sigs):
+    """Recover the values of r, and s, and h from lists of messages and signatures.
 
     Args:
         vk: Verification key
-        msg_i (bytes): message bytes
-        sig_i (bytes): signature bytes
+        msgs (List[bytes]): message bytes
+        sigs (List[bytes]): signature bytes
+
+    Returns:
+        List[tuple]: (r, s, h) for each message and signature pair
     """
-    # Extract out r, s, and h
-    r, s = sigdecode_string(sig, vk.curve.order)
-    h = _truncate_and_convert_digest(vk.default_hashfunc(msg).digest(), vk.curve, True)
-    return r, s, h
+    # Extract out r and s
+    rs_pairs = [sigdecode_string(sig, vk.curve.order) for sig in sigs]
+    # Hash all messages in one pass, then extract out h
+    hashfunc = vk.default_hashfunc
+    digests = [hashfunc(msg).digest() for msg in msgs]
+    hs = [_truncate_and_convert_digest(digest, vk.curve, True) for digest in digests]
+    return [(r, s, h) for (r, s), h in zip(rs_pairs, hs)]
 
 
 def generate_challenge(modulus_len, num_samples, known_fraction, seed=None):
+    """Generate ECDSA signatures whose nonces have known least significant bits.
+
+    Args:
+        modulus_len (int): bit length of the curve order
+        num_samples (int): number of signatures
+        known_fraction (float): fraction of each nonce that is known
+        seed (optional): seed for a deterministic PRNG. If None, randomness is
+            drawn directly from os.urandom. Defaults to None.
+    """
     if num_samples * known_fraction < 1:
         logging.warning(
             "Leaking %f of the nonce bits for %u samples does not meet theoretical requirement",
@@ -50,23 +66,28 @@ def generate_challenge(modulus_len, num_samples, known_fraction, seed=None):
 
     num_known_lsbs = math.ceil(known_fraction * modulus_len)
 
+    msgs = [rng(32) for _ in range(num_samples)]
+    sigs = [sk.sign(msg_i, entropy=rng) for msg_i in msgs]
+    rsh = get_rsh_batch(vk, msgs, sigs)
+
+    # Invert all of the s_i at once
+    s_invs = common.batch_inverse([s_i for _, s_i, _ in rsh], n)
+
+    lsb_mask = (1 << num_known_lsbs) - 1
+
     samples = []
     root = {"x": x}
-    for i in range(num_samples):
-        msg_i = rng(32)
-        sig_i = sk.sign(msg_i, entropy=rng)
-
-        r_i, s_i, h_i = get_rsh(vk, msg_i, sig_i)
+    for i, (msg_i, sig_i, (r_i, s_i, h_i)) in enumerate(zip(msgs, sigs, rsh)):
         # Compute k_i using
         # s == k^-1 (h + rx)
-        k_i = int(inverse_mod(s_i, n) * (h_i + r_i * x) % n)
+        k_i = s_invs[i] * (h_i + r_i * x) % n
 
-        k_i_lsb = k_i % (2**num_known_lsbs)
-        k_i_msb = (k_i - k_i_lsb) >> num_known_lsbs
+        k_i_lsb = k_i & lsb_mask
+        k_i_msb = k_i >> num_known_lsbs
 
         root[f"k_{i}_msb"] = k_i_msb
 
-        samples += [(msg_i, sig_i, k_i_lsb, num_known_lsbs)]
+        samples.append((msg_i, sig_i, k_i_lsb, num_known_lsbs, r_i, s_i, h_i))
 
     challenge = (vk, samples)
     solution = (sk, root)
@@ -74,35 +95,48 @@ def generate_challenge(modulus_len, num_samples, known_fraction, seed=None):
     return solution, challenge
 
 
-def solve_challenge(challenge, solution=None):
+def solve_challenge(challenge, solution=None, verify=False):
+    """Recover the ECDSA signing key from signatures with partially known nonces.
+
+    Args:
+        challenge: verification key and list of samples
+        solution (optional): expected signing key and root, used for testing
+        verify (bool, optional): check every signature before solving. Defaults to False.
+    """
     vk, samples = challenge
     n = int(vk.curve.order)
 
-    # We represent unknowns with variables.
-    x = var("x")  # Represents secret key
+    # We represent unknowns with the generators of a polynomial ring.
+    # x represents the secret key, and k_i_msb the unknown bits of the nonces.
+    names = ["x"] + [f"k_{i}_msb" for i in range(len(samples))]
+    R = PolynomialRing(ZZ, names)
+    x, *k_msbs = R.gens()
     relations = []
     bounds = {x: (0, n)}
+    n_len = n.bit_length()
 
-    for i, (msg_i, sig_i, k_i_lsb, num_known_lsbs) in enumerate(samples):
-        assert vk.verify(sig_i, msg_i)
+    for i, sample in enumerate(samples):
+        # r, s, and h were already recovered when generating the samples
+        msg_i, sig_i, k_i_lsb, num_known_lsbs, r_i, s_i, h_i = sample
+        if verify:
+            assert vk.verify(sig_i, msg_i)
 
-        r_i, s_i, h_i = get_rsh(vk, msg_i, sig_i)
-        k_i_msb = var(f"k_{i}_msb")
+        k_i_msb = k_msbs[i]
 
-        k_i = k_i_msb * 2**num_known_lsbs + k_i_lsb
+        k_i = k_i_msb * (1 << num_known_lsbs) + k_i_lsb
 
-        # ECDSA equation s == k^-1 (h + rx)
-        rel = s_i * k_i == h_i + r_i * x
+        # ECDSA equation s == k^-1 (h + rx), written as s*k - h - rx
+        rel = s_i * k_i - h_i - r_i * x
 
-        relations += [rel]
-        num_unknown_msbs = n.bit_length() - num_known_lsbs
-        bounds[k_i_msb] = (0, 2**num_unknown_msbs)
+        relations.append(rel)
+        bounds[k_i_msb] = (0, 1 << (n_len - num_known_lsbs))
 
     # When testing, it is often helpful to provide the expected solution
     if solution is not None:
         _sk, _root = solution
+        gens = dict(zip(names, R.gens()))
         expected_solution = [
-            _root,
+            {gens[name]: value for name, value in _root.items()},
         ]
     else:
         expected_solution = None
@@ -1,7 +1,8 @@
 import logging
 import math
 
-from sage.all import var, randrange, set_random_seed, random_prime
+from gmpy2 import mpz
+from sage.all import randrange, set_random_seed, random_prime, PolynomialRing, ZZ
 
 import cuso
 
@@ -14,19 +15,24 @@ def generate_challenge(
     divisor_len = math.ceil(sample_len * divisor_fraction)
     err_len = math.floor(divisor_len * err_fraction)
 
+    # Work with GMP integers, and convert back to ints for the challenge
     p = random_prime(1 << divisor_len, proof=False, lbound=1 << (divisor_len - 1))
+    p = mpz(int(p))
+
+    q_bound = 1 << (sample_len - divisor_len)
+    err_bound = 1 << err_len
 
     samples = []
-    root = {"p": p}
+    root = {"p": int(p)}
     for i in range(num_samples):
-        q_i = randrange(1 << (sample_len - divisor_len))
+        q_i = mpz(int(randrange(q_bound)))
 
-        r_i = randrange(-(1 << err_len), 1 << err_len)
+        r_i = int(randrange(-err_bound, err_bound))
         a_i = p * q_i + r_i
 
         root[f"r_{i}"] = r_i
 
-        samples += [a_i]
+        samples.append(int(a_i))
 
     challenge = (samples, divisor_len, err_len)
     solution = (root,)
@@ -37,22 +43,27 @@ def generate_challenge(
 def solve_challenge(challenge, solution=None):
     samples, divisor_len, err_len = challenge
 
-    # We represent unknowns with variables.
+    # We represent unknowns with the generators of a polynomial ring.
+    names = [f"r_{i}" for i in range(len(samples))]
+    R = PolynomialRing(ZZ, names)
     relations = []
     bounds = {}
+    err_bound = 1 << err_len
 
     for i, a_i in enumerate(samples):
-        r_i = var(f"r_{i}")
+        r_i = R.gen(i)
         rel = a_i - r_i
 
-        relations += [rel]
-        bounds[r_i] = (-(2**err_len), 2**err_len)
+        relations.append(rel)
+        bounds[r_i] = (-err_bound, err_bound)
 
     # When testing, it is often helpful to provide the expected solution
     if solution is not None:
         (_root,) = solution
+        # The divisor p is named by a string, which cuso resolves itself
+        gens = dict(zip(names, R.gens()))
         expected_solution = [
-            _root,
+            {gens.get(name, name): value for name, value in _root.items()},
         ]
     else:
         expected_solution = None
@@ -1,35 +1,42 @@
 import logging
 import math
 
-from sage.all import var, inverse_mod, randrange, set_random_seed, random_prime
+from gmpy2 import mpz
+from sage.all import randrange, set_random_seed, random_prime, PolynomialRing, ZZ
 
+import common
 import cuso
 
 
 def generate_challenge(modulus_len, num_samples, known_fraction, seed=None):
     set_random_seed(seed)
 
+    # Work with GMP integers, and convert back to ints for the challenge
     p = random_prime(1 << modulus_len, proof=False, lbound=1 << (modulus_len - 1))
+    p = mpz(int(p))
 
-    alpha = randrange(p)
+    alpha = mpz(int(randrange(p)))
 
     num_known_msbs = math.ceil(known_fraction * modulus_len)
     num_unknown_lsbs = modulus_len - num_known_msbs
 
-    samples = []
-    root = {"alpha": alpha}
-    for i in range(num_samples):
-        x_i = randrange(p)
+    xs = [mpz(int(randrange(p))) for _ in range(num_samples)]
+    # Invert all of the x_i + alpha at once
+    ts = common.batch_inverse([(x_i + alpha) % p for x_i in xs], p)
+
+    lsb_mask = (1 << num_unknown_lsbs) - 1
 
-        t = int(inverse_mod(x_i + alpha, p))
-        lsb_i = t % (2**num_unknown_lsbs)
-        b_i = (t >> num_unknown_lsbs) << num_unknown_lsbs
+    samples = []
+    root = {"alpha": int(alpha)}
+    for i, (x_i, t) in enumerate(zip(xs, ts)):
+        lsb_i = t & lsb_mask
+        b_i = t - lsb_i
 
         root[f"eps_{i}"] = lsb_i
 
-        samples += [(x_i, b_i, num_unknown_lsbs)]
+        samples.append((int(x_i), b_i, num_unknown_lsbs))
 
-    challenge = (p, samples)
+    challenge = (int(p), samples)
     solution = (root,)
 
     return solution, challenge
@@ -38,24 +45,28 @@ def generate_challenge(modulus_len, num_samples, known_fraction, seed=None):
 def solve_challenge(challenge, solution=None):
     p, samples = challenge
 
-    # We represent unknowns with variables.
-    alpha = var("alpha")  # Represents hidden number
+    # We represent unknowns with the generators of a polynomial ring.
+    # alpha represents the hidden number, and eps_i the unknown bits of each sample.
+    names = ["alpha"] + [f"eps_{i}" for i in range(len(samples))]
+    R = PolynomialRing(ZZ, names)
+    alpha, *eps = R.gens()
     relations = []
     bounds = {alpha: (0, p)}
 
     for i, (x_i, b_i, num_unknown_lsbs) in enumerate(samples):
-        eps_i = var(f"eps_{i}")
-        # ECDSA equation b_i = MSB(1 / (alpha + x_i))
-        rel = (b_i + eps_i) * (alpha + x_i) == 1
+        eps_i = eps[i]
+        # b_i = MSB(1 / (alpha + x_i)), written as (b_i + eps_i)(alpha + x_i) - 1
+        rel = (b_i + eps_i) * (alpha + x_i) - 1
 
-        relations += [rel]
-        bounds[eps_i] = (0, 2**num_unknown_lsbs)
+        relations.append(rel)
+        bounds[eps_i] = (0, 1 << num_unknown_lsbs)
 
     # When testing, it is often helpful to provide the expected solution
     if solution is not None:
         (_root,) = solution
+        gens = dict(zip(names, R.gens()))
         expected_solution = [
-            _root,
+            {gens[name]: value for name, value in _root.items()},
         ]
     else:
         expected_solution = None
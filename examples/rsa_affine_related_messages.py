@@ -1,7 +1,8 @@
 import logging
 import math
 
-from sage.all import randrange, var
+from gmpy2 import powmod
+from sage.all import randrange, PolynomialRing, ZZ
 
 import common
 import cuso
@@ -25,8 +26,8 @@ def generate_challenge(modulus_len, related_bits_fraction, seed=None):
 
     pt_2 = (pt_1 + related_value) % n
 
-    ct_1 = pow(pt_1, e, n)
-    ct_2 = pow(pt_2, e, n)
+    ct_1 = common.rsa_encrypt(pt_1, e, n)
+    ct_2 = common.rsa_encrypt(int(pt_2), e, n)
 
     challenge = (pub, ct_1, ct_2, r_bitlen)
     solution = (priv, pt_1, pt_2)
@@ -37,17 +38,16 @@ def generate_challenge(modulus_len, related_bits_fraction, seed=None):
 def solve_challenge(challenge, solution=None):
     (n, e), ct_1, ct_2, r_bitlen = challenge
 
-    # We represent unknowns with variables.
-    # We could equivalently set m and r to the generators of
-    # PolynomialRing(ZZ, 'm, r')
-    m, r = var("m, r")
+    # We represent unknowns with the generators of a polynomial ring.
+    # We could equivalently use symbolic variables m, r = var('m, r')
+    m, r = PolynomialRing(ZZ, "m, r").gens()
     pt_1 = m
     pt_2 = m + r
 
-    # Set relations using RSA equation
+    # Set relations using RSA equation pt**e == ct, written as pt**e - ct
     relations = [
-        ct_1 == pt_1**e,
-        ct_2 == pt_2**e,
+        pt_1**e - ct_1,
+        pt_2**e - ct_2,
     ]
 
     # Specify bounds as a dictionary of (lower_bound, upper_bound) pairs
@@ -80,12 +80,15 @@ def solve_challenge(challenge, solution=None):
     )
 
     assert len(roots) > 0
-    pt_1 = int(pt_1.subs(roots[0]))
-    pt_2 = int(pt_2.subs(roots[0]))
+    root = roots[0]
+    m_value = int(root[m])
+    r_value = int(root[r])
+    pt_1 = m_value
+    pt_2 = (m_value + r_value) % n
 
     # Check that these are the correct plaintexts
-    assert pow(pt_1, e, n) == ct_1
-    assert pow(pt_2, e, n) == ct_2
+    assert powmod(pt_1, e, n) == ct_1
+    assert powmod(pt_2, e, n) == ct_2
     print("Successfully recovered affine related plaintexts.")
     return pt_1, pt_2
 
@@ -1,7 +1,7 @@
 import logging
 import math
 
-from sage.all import var
+from sage.all import PolynomialRing, ZZ
 
 import common
 import cuso
@@ -24,7 +24,7 @@ def generate_challenge(modulus_len, unknown_fraction, seed=None):
     num_unknown_msbs = math.floor(modulus_len * unknown_fraction)
     num_known_lsbs = (modulus_len // 2) - num_unknown_msbs
 
-    p_lsb_value = p % (2**num_known_lsbs)
+    p_lsb_value = p & ((1 << num_known_lsbs) - 1)
 
     challenge = (pub, p_lsb_value, num_known_lsbs)
     solution = (priv,)
@@ -35,11 +35,10 @@ def generate_challenge(modulus_len, unknown_fraction, seed=None):
 def solve_challenge(challenge, solution=None):
     (n, e), p_lsb_value, num_known_lsbs = challenge
 
-    # We represent unknowns with variables.
-    # We could equivalently set x to the generator of
-    # PolynomialRing(ZZ, 'x')
-    x = var("x")
-    p_expr = x * 2**num_known_lsbs + p_lsb_value
+    # We represent unknowns with the generators of a polynomial ring.
+    # We could equivalently use a symbolic variable x = var('x')
+    (x,) = PolynomialRing(ZZ, ["x"]).gens()
+    p_expr = x * (1 << num_known_lsbs) + p_lsb_value
     p_len = n.bit_length() // 2
 
     # The library allows flexibility in specifying input relations.
@@ -55,7 +54,7 @@ def solve_challenge(challenge, solution=None):
     # Specify bounds on x as a dictionary of (lower_bound, upper_bound) pairs
     num_unk_msbs = p_len - num_known_lsbs
     bounds = {
-        x: (0, 2**num_unk_msbs),
+        x: (0, 1 << num_unk_msbs),
     }
 
     # When testing, it is often helpful to provide the expected solution
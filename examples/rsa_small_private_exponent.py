@@ -1,7 +1,8 @@
 import logging
 import math
 
-from sage.all import randrange, var, inverse_mod
+from gmpy2 import mpz, powmod
+from sage.all import randrange, inverse_mod, PolynomialRing, ZZ
 
 import common
 import cuso
@@ -27,10 +28,9 @@ def generate_challenge(modulus_len, private_exponent_fraction, seed=None):
 def solve_challenge_bd99(challenge, solution=None):
     (n, e), priv_exp_len = challenge
 
-    # We represent unknowns with variables.
-    # We could equivalently set k and s to the generators of
-    # PolynomialRing(ZZ, 'k, s')
-    k, s = var("k, s")
+    # We represent unknowns with the generators of a polynomial ring.
+    # We could equivalently use symbolic variables k, s = var('k, s')
+    k, s = PolynomialRing(ZZ, "k, s").gens()
 
     # According to the RSA equations,
     # e * d == 1 + k * phi(n)
@@ -79,8 +79,8 @@ def solve_challenge_bd99(challenge, solution=None):
     d = (1 + k_value * (n - s_value + 1)) // e
 
     # Check that this is a valid decryption exponent
-    r = randrange(1, n)
-    assert pow(pow(r, e, n), d, n) == r
+    r = mpz(int(randrange(1, n)))
+    assert powmod(powmod(r, e, n), d, n) == r
     print("Successfully recovered small RSA private exponent", d)
     return d
 
@@ -88,10 +88,9 @@ def solve_challenge_bd99(challenge, solution=None):
 def solve_challenge_hm10(challenge, solution=None):
     (n, e), priv_exp_len = challenge
 
-    # We represent unknowns with variables.
-    # We could equivalently set k and s to the generators of
-    # PolynomialRing(ZZ, 'k, s')
-    k, s = var("k, s")
+    # We represent unknowns with the generators of a polynomial ring.
+    # We could equivalently use symbolic variables k, s = var('k, s')
+    k, s = PolynomialRing(ZZ, "k, s").gens()
 
     # According to the RSA equations,
     # e * d == 1 + k * phi(n)
@@ -144,8 +143,8 @@ def solve_challenge_hm10(challenge, solution=None):
     d = (1 + k_value * (n - s_value + 1)) // e
 
     # Check that this is a valid decryption exponent
-    r = randrange(1, n)
-    assert pow(pow(r, e, n), d, n) == r
+    r = mpz(int(randrange(1, n)))
+    assert powmod(powmod(r, e, n), d, n) == r
     print("Successfully recovered small RSA private exponent", d)
     return d
 
@@ -153,8 +152,10 @@ def solve_challenge_hm10(challenge, solution=None):
 def solve_challenge_cuso(challenge, solution=None):
     (n, e), priv_exp_len = challenge
 
-    # We represent unknowns with variables.
-    k, p, q = var("k, p, q")
+    # We represent unknowns with the generators of a polynomial ring.
+    # We could equivalently use symbolic variables k, p, q = var('k, p, q')
+    R = PolynomialRing(ZZ, "k, p, q")
+    k, p, q = R.gens()
 
     # According to the RSA equations,
     # e * d == 1 + k * phi(n)
@@ -163,7 +164,7 @@ def solve_challenge_cuso(challenge, solution=None):
     phi = (p - 1) * (q - 1)
     relation_exp = 1 + k * phi
     # We also have n == p * q
-    relation_n = n - p * q
+    relation_n = R(n) - p * q
     relations = [
         relation_exp,
         relation_n,
@@ -208,12 +209,12 @@ def solve_challenge_cuso(challenge, solution=None):
     )
 
     assert len(roots) > 0
-    phi = phi.subs(roots[0])
+    phi = (int(roots[0][p]) - 1) * (int(roots[0][q]) - 1)
     d = int(inverse_mod(e, phi))
 
     # Check that this is a valid decryption exponent
-    r = randrange(1, n)
-    assert pow(pow(r, e, n), d, n) == r
+    r = mpz(int(randrange(1, n)))
+    assert powmod(powmod(r, e, n), d, n) == r
     print("Successfully recovered small RSA private exponent", d)
     return d
 
@@ -1,7 +1,8 @@
 import logging
 import math
 
-from sage.all import randrange, var
+from gmpy2 import powmod
+from sage.all import randrange, PolynomialRing, ZZ
 
 import common
 import cuso
@@ -20,13 +21,13 @@ def generate_challenge(modulus_len: int, unknown_fraction: float, seed=None) ->
         )
 
     plaintext_value = int(randrange(n))
-    ciphertext_value = pow(plaintext_value, e, n)
+    ciphertext_value = common.rsa_encrypt(plaintext_value, e, n)
     # We pick a random plaintext and leak some number of least significant bits.
     # This is to show that the library works even if the input polynomial is not monic.
     num_unknown_msbs = math.floor(modulus_len * unknown_fraction)
     num_known_lsbs = modulus_len - num_unknown_msbs
 
-    lsb_value = plaintext_value % (2**num_known_lsbs)
+    lsb_value = plaintext_value & ((1 << num_known_lsbs) - 1)
 
     challenge = (pub, ciphertext_value, lsb_value, num_known_lsbs)
     solution = (plaintext_value,)
@@ -37,25 +38,23 @@ def generate_challenge(modulus_len: int, unknown_fraction: float, seed=None) ->
 def solve_challenge(challenge, solution=None):
     (n, e), ct, lsb, lsb_len = challenge
 
-    # We represent unknowns with variables.
-    # We could equivalently set x to the generator of
-    # PolynomialRing(ZZ, 'x')
-    x = var("x")
-    pt = x * 2**lsb_len + lsb
+    # We represent unknowns with the generators of a polynomial ring.
+    # We could equivalently use a symbolic variable x = var('x')
+    (x,) = PolynomialRing(ZZ, ["x"]).gens()
+    pt = x * (1 << lsb_len) + lsb
 
     # The library allows flexibility in specifying input relations.
     # Here, all the following are equivalent
-    #     pt**e == ct
     #     pt**e - ct
     #     [pt**e - ct]
     #     cuso.relation.Relation(pt**e - ct, n)
     #     cuso.relation_set.RelationSet([cuso.relation.Relation(pt**e - ct, n)])
-    relations = pt**e == ct
+    relations = pt**e - ct
 
     # Specify bounds as a dictionary of (lower_bound, upper_bound) pairs
     num_unk_msbs = n.bit_length() - lsb_len
     bounds = {
-        x: (0, 2**num_unk_msbs),
+        x: (0, 1 << num_unk_msbs),
     }
 
     # When testing, it is often helpful to provide the expected solution
@@ -75,11 +74,11 @@ def solve_challenge(challenge, solution=None):
     )
 
     assert len(roots) > 0
-    # Substitute the recovered root back into the plaintext expression
-    pt_value = int(pt.subs(roots[0]))
+    # Reassemble the plaintext from the recovered unknown bits
+    pt_value = (int(roots[0][x]) << lsb_len) + lsb
 
     # Check that we got the correct plaintext
-    assert pow(pt_value, e, n) == ct
+    assert powmod(pt_value, e, n) == ct
     print("Successfully recovered stereotyped RSA plaintext.")
     return pt_value
 
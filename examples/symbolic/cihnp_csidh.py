@@ -1,12 +1,10 @@
-from sage.all import PolynomialRing, QQ
-
-from common import print_results
+from common import get_coefficient_field, get_polynomial_ring, print_results
 from cuso.symbolic import SymbolicCoppersmithProblem, get_asymptotic_bounds
 
 
 def run_symbolic():
-    CoeffField = PolynomialRing(QQ, "A_msb,B_msb,C_msb").fraction_field()
-    R = PolynomialRing(CoeffField, "x,y,z")
+    CoeffField = get_coefficient_field("A_msb,B_msb,C_msb")
+    R = get_polynomial_ring(CoeffField, "x,y,z")
 
     A_msb,B_msb,C_msb = CoeffField.gens()
     x,y,z = R.gens()
@@ -1,3 +1,55 @@
+from functools import lru_cache
+
+from sage.all import PolynomialRing, QQ
+
+from cuso.symbolic import get_asymptotic_bounds
+
+
+@lru_cache(maxsize=None)
+def get_coefficient_field(names):
+    """Return the fraction field of QQ[names], reusing it across calls."""
+    return PolynomialRing(QQ, names).fraction_field()
+
+
+@lru_cache(maxsize=None)
+def get_polynomial_ring(coeff_field, names):
+    """Return the polynomial ring coeff_field[names], reusing it across calls."""
+    return PolynomialRing(coeff_field, names)
+
+
+_asymptotic_bounds_cache = {}
+
+
+def cached_asymptotic_bounds(
+    problem,
+    bounds_guess,
+    monomial_vertices,
+    precompute_multiplicity=1,
+    tshifts_to_include=None,
+):
+    """Run get_asymptotic_bounds, reusing the result if the same problem was already analyzed.
+
+    Problems are identified by their description, which lists the relations,
+    moduli, and bounds.
+    """
+    key = (
+        str(problem),
+        tuple(bounds_guess),
+        tuple(monomial_vertices),
+        precompute_multiplicity,
+        tuple(tshifts_to_include) if isinstance(tshifts_to_include, list) else tshifts_to_include,
+    )
+    if key not in _asymptotic_bounds_cache:
+        _asymptotic_bounds_cache[key] = get_asymptotic_bounds(
+            problem,
+            bounds_guess,
+            monomial_vertices,
+            precompute_multiplicity=precompute_multiplicity,
+            tshifts_to_include=tshifts_to_include,
+        )
+    return _asymptotic_bounds_cache[key]
+
+
 def print_results(
     problem,
     bounds_guess,
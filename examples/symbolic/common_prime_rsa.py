@@ -1,6 +1,6 @@
-from sage.all import PolynomialRing, QQ, TermOrder
+from sage.all import QQ, TermOrder
 
-from common import print_results
+from common import get_coefficient_field, get_polynomial_ring, print_results
 from cuso.symbolic import (
     SymbolicCoppersmithProblem,
     SymbolicBounds,
@@ -9,10 +9,10 @@ from cuso.symbolic import (
 
 
 def run_symbolic():
-    CoeffField = PolynomialRing(QQ, "E, N").fraction_field()
+    CoeffField = get_coefficient_field("E, N")
 
     gamma = QQ(45) / 100
-    R = PolynomialRing(CoeffField, "x,y")
+    R = get_polynomial_ring(CoeffField, "x,y")
     E, N = CoeffField.gens()
     x, y = R.gens()
 
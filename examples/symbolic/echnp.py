@@ -1,9 +1,4 @@
-from functools import reduce
-import operator
-
-from sage.all import PolynomialRing, QQ
-
-from common import print_results
+from common import get_coefficient_field, get_polynomial_ring, print_results
 from cuso.symbolic import SymbolicCoppersmithProblem, get_asymptotic_bounds
 
 def echnp(num_samples=3):
@@ -12,7 +7,7 @@ def echnp(num_samples=3):
     known_list = ",".join(
         ["h0", "a", "b"] + [f"h_{i},xQ_{i}" for i in range(num_samples)]
     )
-    CoeffField = PolynomialRing(QQ, known_list).fraction_field()
+    CoeffField = get_coefficient_field(known_list)
     knowns = CoeffField.gens()
     h0, a, b, *_ = knowns
     h_s = [knowns[i] for i in range(3, len(knowns), 2)]
@@ -21,7 +16,7 @@ def echnp(num_samples=3):
     unknown_list = ",".join(
         ["x_0"] + [f"y_{i}" for i in range(num_samples)]
     )
-    R = PolynomialRing(CoeffField, unknown_list)
+    R = get_polynomial_ring(CoeffField, unknown_list)
     x_0, *ys = R.gens()
 
     # List of relations that hold modulo p
@@ -32,11 +27,16 @@ def echnp(num_samples=3):
         hi = h_s[i]
         xQi = xQ_s[i]
 
-        A_i = hi*(h0 - xQi)**2 - 2*h0**2*xQi - 2*(a + xQi**2)*h0 - 2*a*xQi - 4*b
-        B_i = 2*(hi*(h0 - xQi) - 2*h0*xQi - a - xQi**2)
+        # Shared subexpressions of the coefficients
+        xQi_sq = xQi**2
+        h0_m_xQi = h0 - xQi
+        h0_m_xQi_sq = h0_m_xQi**2
+
+        A_i = hi*h0_m_xQi_sq - 2*h0**2*xQi - 2*(a + xQi_sq)*h0 - 2*a*xQi - 4*b
+        B_i = 2*(hi*h0_m_xQi - 2*h0*xQi - a - xQi_sq)
         C_i = hi - 2*xQi
-        D_i = (h0 - xQi)**2
-        E_i = 2*(h0 - xQi)
+        D_i = h0_m_xQi_sq
+        E_i = 2*h0_m_xQi
         mod_rel = A_i + B_i*x_0 + C_i*x_0**2 + D_i*y_i + E_i*x_0*y_i + x_0**2*y_i
         mod_rels += [
             mod_rel
@@ -48,7 +48,7 @@ def echnp(num_samples=3):
 
     precompute_multiplicity = 1
     monomial_vertices = [1, x_0**2] + [y_i**2 for y_i in ys] + [x_0**2*y_i for y_i in ys]
-    monomial_vertices += [reduce(operator.mul, ys, 1)]
+    monomial_vertices += [R.monomial(0, *([1] * len(ys)))]
     tshifts_to_include = [False] * (num_samples + 1)
 
     delta, tau, coprime_cond = get_asymptotic_bounds(
@@ -1,13 +1,17 @@
-from functools import reduce
+from functools import lru_cache
 import itertools
-import operator
 
-from sage.all import PolynomialRing, QQ
+from common import (
+    cached_asymptotic_bounds,
+    get_coefficient_field,
+    get_polynomial_ring,
+    print_results,
+)
+from cuso.symbolic import SymbolicCoppersmithProblem, SymbolicBounds
 
-from common import print_results
-from cuso.symbolic import SymbolicCoppersmithProblem, SymbolicBounds, get_asymptotic_bounds
 
-def mihnp(num_samples=3, simplified=True):
+@lru_cache(maxsize=None)
+def _build_rings(num_samples, simplified):
     # unknowns alpha, eps_i
     # known p, x_i, b_i
     if simplified:
@@ -18,25 +22,55 @@ def mihnp(num_samples=3, simplified=True):
         known_list = ",".join(
             [f"c_{i}" for i in range(num_samples)] + [f"b_{i}" for i in range(num_samples)]
         )
-    CoeffField = PolynomialRing(QQ, known_list).fraction_field()
+    CoeffField = get_coefficient_field(known_list)
     knowns = CoeffField.gens()
     c_s = knowns[:num_samples]
     b_s = knowns[num_samples:2*num_samples]
     if simplified:
         d_s = knowns[2*num_samples:]
+    else:
+        d_s = None
 
     unknown_list = ",".join(
         ["alpha"] + [f"eps_{i}" for i in range(num_samples)]
     )
-    R = PolynomialRing(CoeffField, unknown_list)
+    R = get_polynomial_ring(CoeffField, unknown_list)
     alpha, *eps = R.gens()
+    eps = tuple(eps)
+
+    if num_samples in [4, 5]:
+        power = 1
+    else:
+        power = 2
+    # Vertices of the cube prod_i {1, eps_i**power}, built from exponent tuples
+    monomial_vertices = tuple(
+        R({(0,) + tuple(power if inc else 0 for inc in pattern): 1})
+        for pattern in itertools.product([0, 1], repeat=num_samples)
+    )
 
+    return CoeffField, R, c_s, b_s, d_s, alpha, eps, monomial_vertices
+
+
+def mihnp(num_samples=3, simplified=True):
+    CoeffField, R, c_s, b_s, d_s, alpha, eps, monomial_vertices = _build_rings(
+        num_samples, simplified
+    )
 
     # List of relations that hold modulo p
     mod_rels = []
+    zero = (0,) * (num_samples + 1)
+    alpha_exp = (1,) + zero[1:]
     for i in range(num_samples):
         if simplified:
-            mod_rel = alpha * eps[i] + c_s[i] * eps[i] + b_s[i] * alpha + d_s[i]
+            # alpha * eps_i + c_i * eps_i + b_i * alpha + d_i
+            eps_exp = zero[:i + 1] + (1,) + zero[i + 2:]
+            alpha_eps_exp = (1,) + eps_exp[1:]
+            mod_rel = R({
+                alpha_eps_exp: 1,
+                eps_exp: c_s[i],
+                alpha_exp: b_s[i],
+                zero: d_s[i],
+            })
         else:
             mod_rel = (alpha + c_s[i]) * (eps[i] + b_s[i]) - 1
         mod_rels += [
@@ -47,15 +81,10 @@ def mihnp(num_samples=3, simplified=True):
     prob = SymbolicCoppersmithProblem(mod_rels, bounds, modulus_name="p")
     bounds_guess = [1] + [0.1] * num_samples
     precompute_multiplicity = 2
-    if num_samples in [4, 5]:
-        power = 1
-    else:
-        power = 2
-    cube = itertools.product(*[[1,xi**power] for xi in eps])
-    monomial_vertices = [reduce(operator.mul, vert, 1) for vert in cube]
+    monomial_vertices = list(monomial_vertices)
     tshifts_to_include = [False] * (num_samples + 1)
 
-    delta, tau, coprime_cond = get_asymptotic_bounds(
+    delta, tau, coprime_cond = cached_asymptotic_bounds(
         prob,
         bounds_guess,
         monomial_vertices,
@@ -1,6 +1,6 @@
-from sage.all import PolynomialRing, QQ, TermOrder
+from sage.all import QQ, TermOrder
 
-from common import print_results
+from common import get_coefficient_field, get_polynomial_ring, print_results
 from cuso.symbolic import (
     SymbolicCoppersmithProblem,
     SymbolicBounds,
@@ -9,13 +9,13 @@ from cuso.symbolic import (
 
 
 def run_symbolic():
-    CoeffField = PolynomialRing(QQ, "e").fraction_field()
+    CoeffField = get_coefficient_field("e")
 
     r = 3
     p_len = QQ(1)/(r + 1)
     bounds_guess = [0.1]
 
-    R = PolynomialRing(CoeffField, "x")
+    R = get_polynomial_ring(CoeffField, "x")
     e, = CoeffField.gens()
     x, = R.gens()
     
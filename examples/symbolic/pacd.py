@@ -1,18 +1,31 @@
-from sage.all import PolynomialRing, QQ
+from functools import lru_cache
 
-from common import print_results
-from cuso.symbolic import SymbolicCoppersmithProblem, get_asymptotic_bounds
+from sage.all import QQ
 
+from common import (
+    cached_asymptotic_bounds,
+    get_coefficient_field,
+    get_polynomial_ring,
+    print_results,
+)
+from cuso.symbolic import SymbolicCoppersmithProblem
 
-def pacd(num_samples=1):
+
+@lru_cache(maxsize=None)
+def _build_rings(num_samples):
     known_list = ",".join([f"c_{i}" for i in range(num_samples)])
-    CoeffField = PolynomialRing(QQ, known_list).fraction_field()
+    CoeffField = get_coefficient_field(known_list)
     knowns = CoeffField.gens()
     c_s = knowns
 
     unknown_list = ",".join([f"x_{i}" for i in range(num_samples)])
-    R = PolynomialRing(CoeffField, unknown_list)
+    R = get_polynomial_ring(CoeffField, unknown_list)
     xs = R.gens()
+    return CoeffField, R, c_s, xs
+
+
+def pacd(num_samples=1):
+    CoeffField, R, c_s, xs = _build_rings(num_samples)
 
     # List of relations that hold modulo p
     mod_rels = []
@@ -39,7 +52,7 @@ def pacd(num_samples=1):
     precompute_multiplicity = k
     tshifts_to_include = [True] * num_samples
 
-    delta, tau, coprime_cond = get_asymptotic_bounds(
+    delta, tau, coprime_cond = cached_asymptotic_bounds(
         prob,
         bounds_guess,
         monomial_vertices,
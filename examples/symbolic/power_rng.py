@@ -1,6 +1,4 @@
-from sage.all import PolynomialRing, QQ
-
-from common import print_results
+from common import get_coefficient_field, get_polynomial_ring, print_results
 from cuso.symbolic import (
     SymbolicCoppersmithProblem,
     SymbolicBounds,
@@ -13,13 +11,13 @@ def power_rng(num_samples=2):
     a_names = [f"a_{i}" for i in range(nrels)]
     b_names = [f"b_{i}" for i in range(nrels)]
     all_names = ",".join(a_names + b_names)
-    CoeffField = PolynomialRing(QQ, all_names).fraction_field()
+    CoeffField = get_coefficient_field(all_names)
     known_vars = CoeffField.gens()
     a_s = known_vars[:nrels]
     b_s = known_vars[nrels:]
     
     unk_names = ",".join([f"x_{i}" for i in range(num_samples)])
-    R = PolynomialRing(CoeffField, unk_names)
+    R = get_polynomial_ring(CoeffField, unk_names)
 
     x_s = R.gens()
 
@@ -27,9 +25,10 @@ def power_rng(num_samples=2):
     mod_rels = []
     ul = []
     for i in range(nrels):
-        mod_rel = x_s[i]**2 + a_s[i]*x_s[i] + b_s[i] - x_s[i+1]
+        ul_rel = x_s[i]**2 - x_s[i+1]
+        mod_rel = ul_rel + a_s[i]*x_s[i] + b_s[i]
         mod_rels += [mod_rel]
-        ul += [x_s[i]**2 - x_s[i+1]]
+        ul += [ul_rel]
 
     bounds = [1] * num_samples
     bounds_guess = [0.1] * num_samples
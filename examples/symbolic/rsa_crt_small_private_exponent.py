@@ -1,6 +1,6 @@
-from sage.all import PolynomialRing, QQ
+from sage.all import QQ
 
-from common import print_results
+from common import get_coefficient_field, get_polynomial_ring, print_results
 from cuso.symbolic import (
     SymbolicCoppersmithProblem,
     SymbolicBounds,
@@ -9,8 +9,8 @@ from cuso.symbolic import (
 )
 
 def run_symbolic():
-    CoeffField = PolynomialRing(QQ, "N").fraction_field()
-    R = PolynomialRing(CoeffField, "p, q, k, l")
+    CoeffField = get_coefficient_field("N")
+    R = get_polynomial_ring(CoeffField, "p, q, k, l")
 
     N, = CoeffField.gens()
     p,q,k,l = R.gens()
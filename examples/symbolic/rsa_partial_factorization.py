@@ -1,12 +1,12 @@
-from sage.all import PolynomialRing, QQ
+from sage.all import QQ
 
-from common import print_results
+from common import get_coefficient_field, get_polynomial_ring, print_results
 from cuso.symbolic import SymbolicCoppersmithProblem, get_asymptotic_bounds
 
 
 def run_symbolic():
-    CoeffField = PolynomialRing(QQ, "a").fraction_field()
-    R = PolynomialRing(CoeffField, "x")
+    CoeffField = get_coefficient_field("a")
+    R = get_polynomial_ring(CoeffField, "x")
 
     a, = CoeffField.gens()
     x, = R.gens()
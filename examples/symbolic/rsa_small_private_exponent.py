@@ -1,6 +1,6 @@
-from sage.all import PolynomialRing, QQ
+from sage.all import QQ
 
-from common import print_results
+from common import get_coefficient_field, get_polynomial_ring, print_results
 from cuso.symbolic import (
     SymbolicCoppersmithProblem,
     SymbolicBounds,
@@ -10,8 +10,8 @@ from cuso.symbolic import (
 
 
 def run_symbolic():
-    CoeffField = PolynomialRing(QQ, "a").fraction_field()
-    R = PolynomialRing(CoeffField, "x,y")
+    CoeffField = get_coefficient_field("a")
+    R = get_polynomial_ring(CoeffField, "x,y")
 
     (a,) = CoeffField.gens()
     x, y = R.gens()
@@ -3,6 +3,8 @@
 import math
 from typing import Optional
 
+from sage.all import Infinity
+
 from cuso.data.types import Variable
 
 
@@ -23,13 +25,13 @@ class Bound:
         self.x = x
         self.lower = lower
         self.upper = upper
+        # Missing bounds become infinite sentinels so membership is a single
+        # chained comparison
+        self._lo = -Infinity if lower is None else lower
+        self._hi = Infinity if upper is None else upper
 
     def __contains__(self, value):
-        if self.lower is not None and value <= self.lower:
-            return False
-        if self.upper is not None and value >= self.upper:
-            return False
-        return True
+        return self._lo < value < self._hi
 
     def __iter__(self):
         return iter((self.lower, self.upper))
@@ -37,8 +39,12 @@ class Bound:
     def _bound_as_str(self, boundval) -> str:
         if abs(boundval) < 1000:
             return str(boundval)
-        sgn = boundval // abs(boundval)
-        lg = math.log2(abs(boundval))
+        sgn = 1 if boundval > 0 else -1
+        absval = abs(int(boundval))
+        # Only the top 53 bits matter for the printed precision, so avoid
+        # converting a huge integer to float
+        shift = max(0, absval.bit_length() - 53)
+        lg = shift + math.log2(absval >> shift)
         return f"{sgn * 2}^{lg:.1f}"
 
     def __repr__(self):
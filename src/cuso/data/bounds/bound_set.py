@@ -1,20 +1,58 @@
 """BoundSet class"""
 
 from collections import UserDict
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from sage.all import Expression, Integer
 from sage.all import Polynomial as SagePolynomial
 from sage.rings.polynomial.multi_polynomial import MPolynomial
 
 from cuso.data.solutions import Solution
-from cuso.data.types import Polynomial
+from cuso.data.types import Polynomial, Variable
 from .bound import Bound
 
+# Checks that a key is a single variable, by key type
+_KEY_VALIDATORS = {
+    MPolynomial: lambda key: key.is_generator(),
+    SagePolynomial: lambda key: key.is_gen(),
+    Expression: lambda key: key.is_symbol(),
+}
+# Validator resolved for each concrete key type seen so far
+_KEY_VALIDATOR_CACHE = {}
+
+
+def _get_key_validator(key_type):
+    try:
+        return _KEY_VALIDATOR_CACHE[key_type]
+    except KeyError:
+        pass
+    validator = None
+    for cls in key_type.__mro__:
+        validator = _KEY_VALIDATORS.get(cls)
+        if validator is not None:
+            break
+    _KEY_VALIDATOR_CACHE[key_type] = validator
+    return validator
+
 
 class BoundSet(UserDict):
     """Represent a collection of upper and lower bounds on variables."""
 
+    def __init__(self, *args, **kwargs):
+        # Maximum absolute value of each variable, kept in sync with the bounds
+        self._abs_cache = {}
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def _from_validated(
+        cls, bounds: Dict[Variable, Bound], abs_cache: Dict[Variable, int]
+    ) -> "BoundSet":
+        # Construct from bounds already known to be valid, skipping the checks
+        bound_set = cls.__new__(cls)
+        bound_set.data = bounds
+        bound_set._abs_cache = abs_cache
+        return bound_set
+
     def get_lower_bound(self, expr: Expression) -> int:
         """Return the lower bound for the given expression.
 
@@ -84,10 +122,34 @@ class BoundSet(UserDict):
         Returns:
             int: Integer upper bound for the absolute value of the expression
         """
-        upper_bound = self.get_upper_bound(expr)
-        lower_bound = self.get_lower_bound(expr)
+        lower_bound, upper_bound = self.get_range(expr)
         return max(abs(upper_bound), abs(lower_bound))
 
+    def get_range(self, expr: Expression) -> Tuple[int, int]:
+        """Return the lower and upper bounds for the given expression.
+
+        For polynomials, both bounds come from a single pass over the terms.
+
+        Args:
+            expr (Expression): Expression to evaluate
+
+        Raises:
+            ValueError: A bound is not defined for one of the symbols
+
+        Returns:
+            Tuple[int, int]: Integer lower and upper bounds for the expression
+        """
+        if isinstance(expr, int):
+            return expr, expr
+        if expr in self or isinstance(expr, Expression):
+            return self.get_lower_bound(expr), self.get_upper_bound(expr)
+        try:
+            max_bound = self.get_poly_max_bound(expr)
+        except TypeError as exc:
+            err_str = f"Could not find bounds for {expr}. Are all bounds specified?"
+            raise ValueError(err_str) from exc
+        return -max_bound, max_bound
+
     def get_poly_max_bound(self, poly: Polynomial) -> int:
         """Return a bound on the absolute value of the evaluation of a polynomial.
 
@@ -97,14 +159,75 @@ class BoundSet(UserDict):
         Returns:
             int: maximum absolute value of the polynomial within the bounds
         """
-        maxval = 0
+        terms = poly.dict()
+        if len(terms) == 0:
+            return 0
         ring = poly.parent()
-        for ci, mi in zip(poly.coefficients(), poly.monomials()):
-            maxabs = [max(map(abs, self[xi])) for xi in ring.gens()]
-            maxterm = abs(ci) * int(mi(*maxabs))
-            maxval += maxterm
+        maxabs = [self._abs_cache[xi] for xi in ring.gens()]
+        if None in maxabs:
+            raise TypeError("Polynomial variable is missing a lower or upper bound")
+        if isinstance(poly, SagePolynomial):
+            # Univariate exponents are integers rather than tuples
+            terms = {(ei,): ci for ei, ci in terms.items()}
+
+        # Monomials of a polynomial share many variable powers, so compute each
+        # power of each bound only once
+        power_tables = [{} for _ in maxabs]
+        maxval = 0
+        for exps, ci in terms.items():
+            maxterm = 1
+            for mj, ej, table in zip(maxabs, exps, power_tables):
+                if ej:
+                    power = table.get(ej)
+                    if power is None:
+                        power = mj**ej
+                        table[ej] = power
+                    maxterm *= power
+            maxval += abs(ci) * maxterm
         return int(maxval)
 
+    def get_monomial_abs_bounds(self, monomials: List[Polynomial]) -> List[int]:
+        """Return bounds on the absolute values of several monomials.
+
+        The powers of each variable bound are computed once and shared by all
+        monomials.
+
+        Args:
+            monomials (List[Polynomial]): Monomials of a common polynomial ring
+
+        Raises:
+            ValueError: A bound is not defined for one of the variables
+
+        Returns:
+            List[int]: maximum absolute value of each monomial within the bounds
+        """
+        if len(monomials) == 0:
+            return []
+        ring = monomials[0].parent()
+        maxabs = [self._abs_cache.get(xi) for xi in ring.gens()]
+        is_univariate = isinstance(monomials[0], SagePolynomial)
+
+        power_tables = [{} for _ in maxabs]
+        abs_bounds = []
+        for m in monomials:
+            exps = m.exponents()[0]
+            if is_univariate:
+                exps = (exps,)
+            maxterm = 1
+            for mj, ej, table in zip(maxabs, exps, power_tables):
+                if ej:
+                    if mj is None:
+                        raise ValueError(
+                            f"Could not find bounds for {m}. Are all bounds specified?"
+                        )
+                    power = table.get(ej)
+                    if power is None:
+                        power = mj**ej
+                        table[ej] = power
+                    maxterm *= power
+            abs_bounds += [int(maxterm)]
+        return abs_bounds
+
     def check(self, solution: Solution) -> bool:
         """Check whether the solution satisfies the bounds.
 
@@ -114,34 +237,33 @@ class BoundSet(UserDict):
         Returns:
             bool: All supplied values match bounds.
         """
-        for value in solution.values():
-            if not isinstance(value, (int, Integer)):
-                raise TypeError(f"Solution value {value} is not integer.")
-
-        for xi, bound in self.items():
-            if xi not in solution:
-                continue
-            val = solution[xi]
-            if val not in bound:
+        for xi, val in solution.items():
+            if not isinstance(val, (int, Integer)):
+                raise TypeError(f"Solution value {val} is not integer.")
+            bound = self.data.get(xi)
+            if bound is not None and val not in bound:
                 return False
         return True
 
     def __setitem__(self, key, value):
         # Check keys
-        type_error_s = "Keys must be symbols or generators of a polynomial ring"
-        if isinstance(key, (MPolynomial, SagePolynomial)):
-            if isinstance(key, MPolynomial) and not key.is_generator():
-                raise TypeError(type_error_s)
-            if isinstance(key, SagePolynomial) and not key.is_gen():
-                raise TypeError(type_error_s)
-        elif isinstance(key, Expression):
-            if not key.is_symbol():
-                raise TypeError(type_error_s)
-        else:
-            raise TypeError(type_error_s)
+        validator = _get_key_validator(type(key))
+        if validator is None or not validator(key):
+            raise TypeError("Keys must be symbols or generators of a polynomial ring")
         if not isinstance(value, Bound):
             value = Bound(key, *value)
         super().__setitem__(key, value)
+        if value.lower is None or value.upper is None:
+            self._abs_cache[key] = None
+        else:
+            self._abs_cache[key] = int(max(abs(value.lower), abs(value.upper)))
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        del self._abs_cache[key]
+
+    def copy(self):
+        return self.__class__(self)
 
     def __repr__(self):
         s = "BoundSet for "
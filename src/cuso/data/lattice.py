@@ -39,6 +39,26 @@ class Lattice:
         self.modulus: Modulus = modulus
         self.scale_factors: List[Integer] = scale_factors
         self.is_primal: bool = is_primal
+        # Column of the constant monomial, or None if there is none
+        self.one_index: Optional[int] = (
+            monomials.index(1) if 1 in monomials else None
+        )
+        # Rows of the basis, extracted on first use
+        self._rows = None
+
+        if is_primal is False and len(monomials) > 0:
+            # Exponent of each column's monomial, for assembling relations
+            self._ring = monomials[0].parent()
+            self._monom_exps = [m.exponents()[0] for m in monomials]
+
+        if scale_factors is not None:
+            # Columns with infinite scale must be zero; the rest scale componentwise
+            self._infinite_columns = [
+                j for j, s_j in enumerate(scale_factors) if s_j == Infinity
+            ]
+            self._finite_scales = vector(
+                [0 if s_j == Infinity else s_j for s_j in scale_factors]
+            )
 
     def get_scaled_vector(self, index: int) -> vector:
         """Return the scaled basis vector in row INDEX.
@@ -52,21 +72,31 @@ class Lattice:
         Returns:
             vector: scaled basis vector
         """
-        vec = self.get_vector(index)
+        vec = self._get_vector_unchecked(index)
         if self.scale_factors is None:
-            scaled_vec = vec
-        else:
-            scaled_vec = []
-            for s_i, v_i in zip(self.scale_factors, vec):
-                if s_i == Infinity:
-                    if v_i == 0:
-                        scaled_vec += [0]
-                    else:
-                        raise ValueError("Vector is infinitely large")
-                else:
-                    scaled_vec += [s_i * v_i]
-            scaled_vec = vector(scaled_vec)
-        return scaled_vec
+            return vec
+        if self._has_infinite_entry(vec):
+            raise ValueError("Vector is infinitely large")
+        return vec.pairwise_product(self._finite_scales)
+
+    def is_infinitely_large(self, index: int) -> bool:
+        """Check whether the scaled basis vector in row INDEX is infinitely large.
+
+        This is the case when the vector is nonzero in a column with an
+        infinite scale factor.
+
+        Args:
+            index (int): The row to check.
+
+        Returns:
+            bool: True if get_scaled_vector would fail for this row.
+        """
+        if self.scale_factors is None:
+            return False
+        return self._has_infinite_entry(self._get_vector_unchecked(index))
+
+    def _has_infinite_entry(self, vec: vector) -> bool:
+        return any(vec[j] != 0 for j in self._infinite_columns)
 
     def get_vector(self, index: int) -> vector:
         """Return the unscaled basis vector in row INDEX
@@ -86,7 +116,12 @@ class Lattice:
         if index < 0 or index >= self.basis.nrows():
             raise IndexError
 
-        return self.basis[index]
+        return self._get_vector_unchecked(index)
+
+    def _get_vector_unchecked(self, index: int) -> vector:
+        if self._rows is None:
+            self._rows = self.basis.rows()
+        return self._rows[index]
 
     def get_relation(self, index: int) -> Relation:
         """Return the relation corresponding to basis vector INDEX.
@@ -104,10 +139,10 @@ class Lattice:
         """
         if self.is_primal is not False:
             raise TypeError("Can only get relation from dual lattice.")
-        vec = self.get_vector(index)
-        poly = 0
-        for v_i, m_i in zip(vec, self.monomials):
-            poly += v_i * m_i
+        vec = self._get_vector_unchecked(index)
+        # Only visit the nonzero entries of the (typically sparse) vector
+        monom_exps = self._monom_exps
+        poly = self._ring({monom_exps[j]: v_j for j, v_j in vec.dict().items()})
         return Relation(poly, self.modulus)
 
     def rank(self) -> int:
@@ -27,6 +27,23 @@ class MultivariateCoppersmithProblem:
         """
         self.relations: RelationSet = relations
         self.bounds: BoundSet = bounds
+        # (relations, variables, unknown moduli, all required solution keys) for
+        # the last relations seen
+        self._variable_cache = None
+
+    def _get_variable_cache(self):
+        # RelationSets are immutable, so the cache is valid until the
+        # relations attribute is replaced
+        if self._variable_cache is None or self._variable_cache[0] is not self.relations:
+            variables = self.relations.variables()
+            unknown_moduli = self.relations.unknown_moduli()
+            self._variable_cache = (
+                self.relations,
+                variables,
+                unknown_moduli,
+                frozenset(variables) | frozenset(unknown_moduli),
+            )
+        return self._variable_cache
 
     def variables(self) -> List[Variable]:
         """Get variables appearing in the relations.
@@ -34,7 +51,7 @@ class MultivariateCoppersmithProblem:
         Returns:
             List[Variables]: List of variables
         """
-        return self.relations.variables()
+        return self._get_variable_cache()[1]
 
     def unknown_moduli(self) -> List[Variable]:
         """Get variables appearing in the moduli.
@@ -42,7 +59,7 @@ class MultivariateCoppersmithProblem:
         Returns:
             List[Variable]: List of symbols in the moduli.
         """
-        return self.relations.unknown_moduli()
+        return self._get_variable_cache()[2]
 
     def check(self, solutions: SolutionSet) -> bool:
         """Check whether the solutions satisfy the relations.
@@ -60,30 +77,27 @@ class MultivariateCoppersmithProblem:
             raise TypeError("Expected solutions to be SolutionSet")
 
         # Check that all unknown appear in the solution
-        variables = self.variables()
-        moduli_variables = self.unknown_moduli()
+        _, variables, moduli_variables, required = self._get_variable_cache()
         for soln in solutions:
-            for xi in variables:
-                if xi not in soln:
-                    logger.warning("Value of %s missing from solution %s", xi, soln)
-                    return False
-                if not isinstance(soln[xi], (int, Integer)):
-                    raise TypeError(f"Solution value {soln[xi]} must be integer.")
-            for pi in moduli_variables:
-                if pi not in soln:
-                    logger.warning("Value of modulus %s missing from %s", pi, soln)
-                    return False
-                if not isinstance(soln[pi], (int, Integer)):
-                    raise TypeError(f"Solution value {soln[pi]} must be integer.")
-
+            missing = required.difference(soln)
+            if missing:
+                for xi in variables:
+                    if xi in missing:
+                        logger.warning("Value of %s missing from solution %s", xi, soln)
+                        return False
+                for pi in moduli_variables:
+                    if pi in missing:
+                        logger.warning("Value of modulus %s missing from %s", pi, soln)
+                        return False
+            for key in required:
+                if not isinstance(soln[key], (int, Integer)):
+                    raise TypeError(f"Solution value {soln[key]} must be integer.")
+
+        # Check that the solutions satisfy the bounds
         for soln in solutions:
-            # Check that the solution satisfies the bounds
             if not self.bounds.check(soln):
                 return False
-            if not self.relations.check(soln):
-                return False
-
-        return True
+        return self.relations.check_many(solutions)
 
     def __repr__(self):
         variables = self.variables()
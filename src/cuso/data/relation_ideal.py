@@ -1,5 +1,6 @@
 """Implementation of ideals of relations"""
 
+from functools import lru_cache, reduce
 from typing import List
 
 from sage.all import gcd, Integer, PolynomialRing, Ideal
@@ -7,6 +8,30 @@ from sage.all import gcd, Integer, PolynomialRing, Ideal
 from cuso.data.types import Polynomial, Modulus
 
 
+@lru_cache(maxsize=None)
+def _extended_ring(ring: PolynomialRing) -> PolynomialRing:
+    # Add an unused variable so that a univariate ring is multivariate
+    return ring.extend_variables("tmp_unused")
+
+
+@lru_cache(maxsize=1024)
+def _modulus_gcd(mod1: Modulus, mod2: Modulus) -> Modulus:
+    # The same pairs of moduli are combined many times while building ideals
+    new_modulus = gcd(mod1, mod2)
+    if isinstance(new_modulus, Integer):
+        new_modulus = int(new_modulus)
+    return new_modulus
+
+
+def _is_zero_ideal(ideal: Ideal) -> bool:
+    return all(f == 0 for f in ideal.gens())
+
+
+def _is_unit_ideal(ideal: Ideal) -> bool:
+    # Only detects ideals with a unit generator, which is all we need to skip work
+    return any(f.is_unit() for f in ideal.gens())
+
+
 class RelationIdeal:
     """Implement ideals of relations.
 
@@ -30,6 +55,20 @@ class RelationIdeal:
         self.ideal: Ideal = ring.ideal(polynomials)
         self._ring: PolynomialRing = ring
         self.modulus: Modulus = modulus
+        # Groebner bases already computed, keyed by term order
+        self._gb_cache = {}
+
+    @classmethod
+    def _from_ideal(
+        cls, ideal: Ideal, ring: PolynomialRing, modulus: Modulus, gb_cache=None
+    ) -> "RelationIdeal":
+        # Wrap an existing Sage ideal without rebuilding it from its generators
+        relation_ideal = cls.__new__(cls)
+        relation_ideal.ideal = ideal
+        relation_ideal._ring = ring
+        relation_ideal.modulus = modulus
+        relation_ideal._gb_cache = dict(gb_cache) if gb_cache else {}
+        return relation_ideal
 
     def ring(self) -> PolynomialRing:
         """Get the parent ring
@@ -45,10 +84,43 @@ class RelationIdeal:
         Returns:
             List[Polynomial]: Groebner basis
         """
+        key = str(self._ring.term_order())
+        gb = self._gb_cache.get(key)
+        if gb is None:
+            gb = self._compute_groebner_basis()
+            self._gb_cache[key] = gb
+        return list(gb)
+
+    def _compute_groebner_basis(self) -> List[Polynomial]:
+        gens = [f for f in self.ideal.gens() if f != 0]
+        if len(gens) == 0:
+            return []
+        if len(gens) == 1:
+            # A single generator is a Groebner basis over ZZ; normalize the sign
+            # to match Singular's output
+            f = gens[0]
+            return [-f] if f.lc() < 0 else [f]
+        if all(f.is_monomial() for f in gens):
+            # For monic monomials, the minimal ones under divisibility form the
+            # reduced Groebner basis
+            gens = list(set(gens))
+            minimal = [
+                f
+                for f in gens
+                if not any(g != f and g.divides(f) for g in gens)
+            ]
+            return sorted(minimal)
+
         # Check if univariate
         if len(self._ring.gens()) == 1:
-            # Add an unused variable so that the ring is multivariate
-            new_ring = self._ring.extend_variables("tmp_unused")
+            # ZZ[x] is not a PID, so the gcd only generates the ideal when it is
+            # itself one of the generators
+            g = reduce(gcd, gens)
+            if g.lc() < 0:
+                g = -g
+            if any(f in (g, -g) for f in gens):
+                return [g]
+            new_ring = _extended_ring(self._ring)
             new_ideal = new_ring.ideal(self.ideal)
             new_groebner = new_ideal.groebner_basis()
             groebner = [self._ring(f) for f in new_groebner]
@@ -81,17 +153,29 @@ class RelationIdeal:
             raise TypeError("Can only add relation ideal to relation ideal")
         if self.ring() != other.ring():
             raise ValueError("Relation ideals must have the same ring")
-        new_ideal = self.ideal + other.ideal
         new_ring = self.ring()
         if self.modulus is None:
             new_modulus = other.modulus
         elif other.modulus is None:
             new_modulus = self.modulus
+        elif self.modulus is other.modulus or (
+            isinstance(self.modulus, int) and self.modulus == other.modulus
+        ):
+            new_modulus = self.modulus
         else:
-            new_modulus = gcd(self.modulus, other.modulus)
-            if isinstance(new_modulus, Integer):
-                new_modulus = int(new_modulus)
-        return RelationIdeal(new_ideal.gens(), new_ring, new_modulus)
+            new_modulus = _modulus_gcd(self.modulus, other.modulus)
+        # 0 + J = J and 1 + J = 1, so skip the ideal arithmetic
+        for trivial, result in ((self, other), (other, self)):
+            if _is_zero_ideal(trivial.ideal):
+                return RelationIdeal._from_ideal(
+                    result.ideal, new_ring, new_modulus, result._gb_cache
+                )
+            if _is_unit_ideal(trivial.ideal):
+                return RelationIdeal._from_ideal(
+                    trivial.ideal, new_ring, new_modulus, trivial._gb_cache
+                )
+        new_ideal = self.ideal + other.ideal
+        return RelationIdeal._from_ideal(new_ideal, new_ring, new_modulus)
 
     def __mul__(self, other: "RelationIdeal") -> "RelationIdeal":
         """Multiply two relation ideals together.
@@ -114,7 +198,6 @@ class RelationIdeal:
             raise TypeError("Can only multiply relation ideal by relation ideal")
         if self.ring() != other.ring():
             raise ValueError("Relation ideals must have the same ring")
-        new_ideal = self.ideal * other.ideal
         new_ring = self.ring()
         if self.modulus is None:
             new_modulus = other.modulus
@@ -122,4 +205,15 @@ class RelationIdeal:
             new_modulus = self.modulus
         else:
             new_modulus = self.modulus * other.modulus
-        return RelationIdeal(new_ideal.gens(), new_ring, new_modulus)
+        # 0 * J = 0 and 1 * J = J, so skip the ideal arithmetic
+        for trivial, result in ((self, other), (other, self)):
+            if _is_zero_ideal(trivial.ideal):
+                return RelationIdeal._from_ideal(
+                    trivial.ideal, new_ring, new_modulus, trivial._gb_cache
+                )
+            if _is_unit_ideal(trivial.ideal):
+                return RelationIdeal._from_ideal(
+                    result.ideal, new_ring, new_modulus, result._gb_cache
+                )
+        new_ideal = self.ideal * other.ideal
+        return RelationIdeal._from_ideal(new_ideal, new_ring, new_modulus)
@@ -35,7 +35,7 @@ class RelationConverter:
         Returns:
             Relation: Relation in the new problem.
         """
-        return Relation(
+        return Relation._unchecked(
             self.convert_polynomial_to_new(relation.polynomial), relation.modulus
         )
 
@@ -48,7 +48,7 @@ class RelationConverter:
         Returns:
             RelationSet: Relations in the new problem.
         """
-        return RelationSet([self.convert_relation_to_new(rel) for rel in relations])
+        return self._convert_set(relations, self.convert_relation_to_new)
 
     @abstractmethod
     def convert_polynomial_to_old(self, poly: Polynomial) -> Polynomial:
@@ -70,7 +70,7 @@ class RelationConverter:
         Returns:
             Relation: Relation in the old problem.
         """
-        return Relation(
+        return Relation._unchecked(
             self.convert_polynomial_to_old(relation.polynomial), relation.modulus
         )
 
@@ -83,7 +83,17 @@ class RelationConverter:
         Returns:
             RelationSet: Relations in the old problem.
         """
-        return RelationSet([self.convert_relation_to_old(rel) for rel in relations])
+        return self._convert_set(relations, self.convert_relation_to_old)
+
+    @staticmethod
+    def _convert_set(relations: RelationSet, convert_relation) -> RelationSet:
+        # Conversion keeps each modulus, so the unknown moduli carry over and
+        # the converted relations need no revalidation
+        relations = RelationSet(relations)
+        converted = [convert_relation(rel) for rel in relations]
+        return RelationSet._from_validated(
+            converted, converted[0].ring(), relations.unknown_moduli()
+        )
 
 
 class RenameRelationConverter(RelationConverter):
@@ -109,6 +119,21 @@ class RenameRelationConverter(RelationConverter):
         self.orig_ring = orig[0].parent()
         self.new_ring = new[0].parent()
 
+        self._new_subs = dict(zip(orig, new))
+        self._old_subs = dict(zip(new, orig))
+
+        # Ring homomorphisms are much faster than subs, but need an image for
+        # every generator of the domain
+        self._to_new_hom = self._get_hom(self._new_subs, self.orig_ring, self.new_ring)
+        self._to_old_hom = self._get_hom(self._old_subs, self.new_ring, self.orig_ring)
+
+    @staticmethod
+    def _get_hom(images, domain, codomain):
+        try:
+            return domain.hom([images[xi] for xi in domain.gens()], codomain)
+        except (KeyError, TypeError, ValueError):
+            return None
+
     def convert_polynomial_to_new(self, poly: Polynomial) -> Polynomial:
         """Convert a Polynomial of the old type to the new type.
 
@@ -118,9 +143,9 @@ class RenameRelationConverter(RelationConverter):
         Returns:
             Polynomial: Polynomial in the new problem.
         """
-        to_subs = {o: n for o, n in zip(self.orig, self.new)}
-        new_poly = self.new_ring(poly.subs(to_subs))
-        return new_poly
+        if self._to_new_hom is not None and poly.parent() is self.orig_ring:
+            return self._to_new_hom(poly)
+        return self.new_ring(poly.subs(self._new_subs))
 
     def convert_polynomial_to_old(self, poly: Polynomial) -> Polynomial:
         """Convert a Polynomial of the new type to the old type.
@@ -131,6 +156,6 @@ class RenameRelationConverter(RelationConverter):
         Returns:
             Polynomial: Polynomial in the old problem.
         """
-        to_subs = {n: o for o, n in zip(self.orig, self.new)}
-        old_poly = self.orig_ring(poly.subs(to_subs))
-        return old_poly
+        if self._to_old_hom is not None and poly.parent() is self.new_ring:
+            return self._to_old_hom(poly)
+        return self.orig_ring(poly.subs(self._old_subs))
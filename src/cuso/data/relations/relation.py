@@ -1,11 +1,12 @@
 """Represent a constraint, or an integer polynomial with either a modular or integer constraint."""
 
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Tuple
 
-from sage.all import Polynomial, Expression, ZZ, Integer, PolynomialRing
+import numpy as np
+from sage.all import Polynomial, Expression, ZZ, Integer, PolynomialRing, fast_callable
 from sage.rings.polynomial.multi_polynomial import MPolynomial
 
-from cuso.data.solutions import Solution
+from cuso.data.solutions import Solution, SolutionSet
 from cuso.data.types import Variable, Modulus
 
 
@@ -31,8 +32,41 @@ class Relation:
         if isinstance(modulus, Integer):
             modulus = int(modulus)
 
+        self._set_fields(polynomial, modulus)
+
+    @classmethod
+    def _unchecked(
+        cls, polynomial: Polynomial, modulus: Optional[Modulus] = None
+    ) -> "Relation":
+        # Construct a relation whose polynomial and modulus are known to be valid
+        relation = cls.__new__(cls)
+        relation._set_fields(polynomial, modulus)
+        return relation
+
+    def _set_fields(self, polynomial: Polynomial, modulus: Optional[Modulus]):
         self.polynomial = polynomial
         self.modulus = modulus
+        self._ring = polynomial.parent()
+        self._vars = self._ring.gens()
+        # Integer modulus as a Sage Integer, so checks use GMP divisibility
+        self._zz_modulus = ZZ(abs(modulus)) if isinstance(modulus, int) else None
+        # Symbols of a symbolic modulus, in the order its evaluator takes them
+        if isinstance(modulus, Expression):
+            self._mod_vars = tuple(modulus.variables())
+        else:
+            self._mod_vars = ()
+        # Exponent and coefficient arrays for batch evaluation, built on first use
+        self._compiled = None
+        # Compiled evaluators for single solutions, built on first use
+        self._fast_eval = None
+        self._fast_mod_eval = None
+
+    def __getstate__(self):
+        # Compiled evaluators cannot be pickled; they are rebuilt on first use
+        state = self.__dict__.copy()
+        state["_fast_eval"] = None
+        state["_fast_mod_eval"] = None
+        return state
 
     def ring(self) -> PolynomialRing:
         """Get the Polynomial Ring for this relation.
@@ -40,7 +74,7 @@ class Relation:
         Returns:
             PolynomialRing: The ring
         """
-        return self.polynomial.parent()
+        return self._ring
 
     def variables(self) -> List[Variable]:
         """Get the variables in the polynomial ring
@@ -48,13 +82,11 @@ class Relation:
         Returns:
             List[Variable]: List of polynomial ring generators
         """
-        return self.ring().gens()
+        return self._vars
 
-    def unknown_moduli(self) -> List[Variable]:
-        """Get the list of unknown moduli"""
-        if self.modulus is None or isinstance(self.modulus, int):
-            return []
-        return self.modulus.variables()
+    def unknown_moduli(self) -> Tuple[Variable, ...]:
+        """Get the unknown moduli, computed once at construction"""
+        return self._mod_vars
 
     def check(self, solution: Solution) -> bool:
         """Check if the solution satisfies the constrained relation.
@@ -65,16 +97,62 @@ class Relation:
         Returns:
             bool: True if the values satisfy the relation.
         """
-        root = tuple(solution[xi] for xi in self.variables())
-        value = self.polynomial(*root)
+        value = self.evaluate(solution)
         if self.modulus is None:
             return value == 0
+        if self._zz_modulus is not None:
+            return self._zz_modulus.divides(value)
+        return ZZ(self._modulus_value(solution)).divides(value)
+
+    def evaluate(self, solution: Solution) -> Integer:
+        """Evaluate the polynomial at a solution.
+
+        Args:
+            solution (Solution): Values of all ring variables.
+
+        Returns:
+            Integer: Value of the polynomial.
+        """
+        if self._fast_eval is None:
+            self._fast_eval = fast_callable(
+                self.polynomial, vars=list(self._vars), domain=ZZ
+            )
+        return self._fast_eval(*map(solution.__getitem__, self._vars))
+
+    def _modulus_value(self, solution: Solution) -> int:
         if isinstance(self.modulus, int):
-            mod_value = self.modulus
-        else:
-            mod_value = self.modulus.subs(dict(solution))
-            mod_value = int(mod_value)
-        return value % mod_value == 0
+            return self.modulus
+        if self._fast_mod_eval is None:
+            self._fast_mod_eval = fast_callable(
+                self.modulus, vars=list(self._mod_vars), domain=ZZ
+            )
+        return int(self._fast_mod_eval(*map(solution.__getitem__, self._mod_vars)))
+
+    def _compile(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._compiled is None:
+            nvars = len(self.variables())
+            is_univariate = isinstance(self.polynomial, Polynomial)
+            exps = []
+            coeffs = []
+            for exp, coeff in self.polynomial.dict().items():
+                exps += [(exp,) if is_univariate else tuple(exp)]
+                coeffs += [int(coeff)]
+            self._compiled = (
+                np.array(exps, dtype=object).reshape(len(exps), nvars),
+                np.array(coeffs, dtype=object),
+            )
+        return self._compiled
+
+    def _check_values(self, solutions: SolutionSet, values: np.ndarray) -> bool:
+        # values[k] is the polynomial evaluated at solutions[k]
+        if self.modulus is None:
+            return not (values != 0).any()
+        if isinstance(self.modulus, int):
+            return not (values % self.modulus != 0).any()
+        for soln, value in zip(solutions, values):
+            if value % self._modulus_value(soln) != 0:
+                return False
+        return True
 
     def __mul__(self, other: Union["Relation", Polynomial]) -> "Relation":
         """Multiply two Relations together.
@@ -103,7 +181,7 @@ class Relation:
         else:
             new_polynomial = self.polynomial * self.ring()(other)
             new_modulus = self.modulus
-        return Relation(new_polynomial, new_modulus)
+        return Relation._unchecked(new_polynomial, new_modulus)
 
     def __repr__(self):
         s = "Relation("
@@ -114,3 +192,9 @@ class Relation:
             s += " == 0 modulo " + str(self.modulus)
         s += ")"
         return s
+
+
+def _solutions_to_roots(solutions: SolutionSet, variables: List[Variable]) -> np.ndarray:
+    return np.array(
+        [[int(soln[xi]) for xi in variables] for soln in solutions], dtype=object
+    ).reshape(len(solutions), len(variables))
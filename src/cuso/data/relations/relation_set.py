@@ -1,24 +1,33 @@
 """This module implements the RelationSet, which describes a set of relations."""
 
-from typing import List, Union
+from typing import List, Tuple, Union
 
+import numpy as np
 from sage.all import PolynomialRing
 
-from cuso.data.solutions import Solution
-from cuso.data.types import Variable
-from .relation import Relation
+from cuso.data.solutions import Solution, SolutionSet
+from cuso.data.types import Monomial, Variable
+from .relation import Relation, _solutions_to_roots
+
+# Number of solutions evaluated together in RelationSet.check_many
+_CHECK_BATCH_SIZE = 256
 
 
 class RelationSet:
     """Represent a collection of Relations over a common set of variables."""
 
-    _relations: List[Relation] = None
+    _relations: Tuple[Relation, ...] = None
     _ring: PolynomialRing = None
     _unknown_moduli: List[Variable] = None
+    # Exponents of all monomials and the coefficient matrix, built on first use
+    _compiled: Tuple[np.ndarray, np.ndarray] = None
+    # Sorted monomials of all relations, built on first use
+    _monomials: Tuple[Monomial, ...] = None
 
     def __init__(self, relations: Union[List[Relation], "RelationSet"]):
         if isinstance(relations, RelationSet):
-            self._relations = relations._relations[:]
+            # Relation sets are immutable, so share the relations
+            self._relations = relations._relations
             self._ring = relations._ring
             self._unknown_moduli = relations._unknown_moduli
             return
@@ -39,15 +48,29 @@ class RelationSet:
         else:
             raise ValueError("List of relations cannot be empty.")
 
-        unknown_moduli = []
+        unknown_moduli = set()
         for rel in relations:
-            unknown_moduli += rel.unknown_moduli()
-        unknown_moduli = list(set(unknown_moduli))
+            unknown_moduli.update(rel.unknown_moduli())
+        unknown_moduli = list(unknown_moduli)
 
-        self._relations = relations[:]
+        self._relations = tuple(relations)
         self._ring = ring
         self._unknown_moduli = unknown_moduli
 
+    @classmethod
+    def _from_validated(
+        cls,
+        relations: List[Relation],
+        ring: PolynomialRing,
+        unknown_moduli: List[Variable],
+    ) -> "RelationSet":
+        # Construct from relations already known to be valid, skipping the checks
+        relation_set = cls.__new__(cls)
+        relation_set._relations = tuple(relations)
+        relation_set._ring = ring
+        relation_set._unknown_moduli = unknown_moduli
+        return relation_set
+
     def ring(self) -> PolynomialRing:
         """Returns the polynomial ring.
 
@@ -64,6 +87,19 @@ class RelationSet:
         """
         return self.ring().gens()
 
+    def monomials(self) -> List[Monomial]:
+        """Return the sorted list of monomials that appear in the relations.
+
+        Returns:
+            List[Monomial]: Monomials in increasing order.
+        """
+        if self._monomials is None:
+            monomials = set()
+            for relation in self:
+                monomials.update(relation.polynomial.monomials())
+            self._monomials = tuple(sorted(monomials))
+        return list(self._monomials)
+
     def unknown_moduli(self):
         """Return the list of symbolic moduli.
 
@@ -86,10 +122,65 @@ class RelationSet:
                 return False
         return True
 
+    def check_many(self, solutions: SolutionSet) -> bool:
+        """Check if every solution satisfies all relations.
+
+        Relations are evaluated in batches of solutions, stopping at the first
+        batch that fails.
+
+        Args:
+            solutions (SolutionSet): Dictionaries of variable values.
+
+        Returns:
+            bool: All solutions satisfy all relations.
+        """
+        monom_exps, coeff_matrix = self._compile()
+        variables = self.variables()
+        for start in range(0, len(solutions), _CHECK_BATCH_SIZE):
+            batch = solutions[start : start + _CHECK_BATCH_SIZE]
+            roots = _solutions_to_roots(batch, variables)
+            # Evaluate each distinct monomial once, then every relation at once
+            monom_values = (roots[:, None, :] ** monom_exps[None, :, :]).prod(axis=-1)
+            values = monom_values.dot(coeff_matrix.T)
+            for i, relation in enumerate(self):
+                if not relation._check_values(batch, values[:, i]):
+                    return False
+        return True
+
+    def _compile(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._compiled is None:
+            monom_index = {}
+            rows = []
+            for relation in self:
+                exps, coeffs = relation._compile()
+                row = {}
+                for exp, coeff in zip(exps, coeffs):
+                    j = monom_index.setdefault(tuple(exp), len(monom_index))
+                    row[j] = coeff
+                rows += [row]
+            nvars = len(self.variables())
+            monom_exps = np.array(list(monom_index), dtype=object).reshape(
+                len(monom_index), nvars
+            )
+            coeff_matrix = np.zeros((len(rows), len(monom_index)), dtype=object)
+            for i, row in enumerate(rows):
+                for j, coeff in row.items():
+                    coeff_matrix[i, j] = coeff
+            self._compiled = (monom_exps, coeff_matrix)
+        return self._compiled
+
     def __getitem__(self, key):
         """Allow iteration over and accessing Relations in a RelationSet"""
         if isinstance(key, slice):
-            return RelationSet(self._relations[key])
+            relations = self._relations[key]
+            if len(relations) == 0:
+                raise ValueError("List of relations cannot be empty.")
+            unknown_moduli = set()
+            for rel in relations:
+                unknown_moduli.update(rel.unknown_moduli())
+            return RelationSet._from_validated(
+                relations, self._ring, list(unknown_moduli)
+            )
         return self._relations[key]
 
     def __len__(self) -> int:
@@ -110,7 +201,12 @@ class RelationSet:
             RelationSet: RelationSet containing all relations
         """
         other = RelationSet(other)
-        return RelationSet(self._relations + other._relations)
+        if self._ring != other._ring:
+            raise ValueError("All Relations in RelationSet must share a polynomial ring")
+        unknown_moduli = set(self._unknown_moduli) | set(other._unknown_moduli)
+        return RelationSet._from_validated(
+            self._relations + other._relations, self._ring, list(unknown_moduli)
+        )
 
     def __repr__(self):
         s = "RelationSet with "
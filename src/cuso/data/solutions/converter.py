@@ -75,6 +75,8 @@ class RenameSolutionConverter(SolutionConverter):
             raise ValueError("Old and new must be same length")
         self.orig = orig
         self.new = new
+        self._to_new = dict(zip(orig, new))
+        self._to_old = dict(zip(new, orig))
 
     def convert_solution_to_new(self, solution: Solution) -> Solution:
         """Convert a Solution of the old type to the new type.
@@ -85,8 +87,8 @@ class RenameSolutionConverter(SolutionConverter):
         Returns:
             Solution: Solution of the new problem.
         """
-        to_subs = {o: n for o, n in zip(self.orig, self.new)}
-        new_soln = {to_subs.get(k, k): v for k, v in solution.items()}
+        to_new = self._to_new
+        new_soln = {to_new.get(k, k): v for k, v in solution.items()}
         return Solution(new_soln)
 
     def convert_solution_to_old(self, solution: Solution) -> Solution:
@@ -98,6 +100,6 @@ class RenameSolutionConverter(SolutionConverter):
         Returns:
             Solution: Solution of the old problem.
         """
-        to_subs = {n: o for o, n in zip(self.orig, self.new)}
-        old_soln = {to_subs.get(k, k): v for k, v in solution.items()}
+        to_old = self._to_old
+        old_soln = {to_old.get(k, k): v for k, v in solution.items()}
         return Solution(old_soln)
@@ -1,6 +1,7 @@
 """This module implements the AutomatedSolver"""
 
 from functools import reduce
+import math
 
 from sage.all import Expression, gcd, PolynomialRing, ZZ
 
@@ -39,27 +40,53 @@ class AutomatedSolver(FullSolver):
 
         evaluations = []
         moduli = []
-        root = {x_i: v for x_i, v in soln.items() if x_i in relations.ring().gens()}
+        ring = relations.ring()
+        ring_gens = ring.gens()
+        gens = frozenset(ring_gens)
+        root = {x_i: v for x_i, v in soln.items() if x_i in gens}
+        # With every variable known, use the relations' compiled evaluators
+        # rather than symbolic substitution
+        all_known = len(root) == len(gens)
+        # Otherwise, substitute by calling the polynomial on a full tuple of
+        # values, keeping unknown generators in place
+        values = tuple(root.get(x_i, x_i) for x_i in ring_gens)
 
         for rel in relations:
-            evaluation = rel.polynomial.subs(root)
-            try:
-                evaluation = int(evaluation)
-                evaluations += [evaluation]
+            if all_known:
+                evaluations += [int(rel.evaluate(root))]
                 moduli += [rel.modulus]
-            except TypeError:
-                # Could fail if we only have solutions for some of the variables
                 continue
+            if rel.polynomial.parent() is ring:
+                evaluation = rel.polynomial(*values)
+            else:
+                evaluation = rel.polynomial.subs(root)
+            if not evaluation.is_constant():
+                # We may only have solutions for some of the variables
+                continue
+            evaluations += [int(evaluation.constant_coefficient())]
+            moduli += [rel.modulus]
+
+        # Only relations with symbolic moduli can reveal an unknown modulus.
+        # Group them by modulus, keeping the gcd of each group's evaluations.
+        groups = {}
+        for eval_i, mod_i in zip(evaluations, moduli):
+            if not isinstance(mod_i, Expression):
+                continue
+            key = str(mod_i)
+            if key not in groups:
+                groups[key] = [mod_i, mod_i.variables(), 0]
+            group = groups[key]
+            if group[2] != 1:
+                group[2] = math.gcd(group[2], eval_i)
 
         for p_i in relations.unknown_moduli():
             # If p_i is in the modulus, compute GCD
-            eval_p = []
+            eval_p = 0
             mod_p = []
-            for eval_i, mod_i in zip(evaluations, moduli):
-                if isinstance(mod_i, Expression) and mod_i.degree(p_i) > 0:
-                    eval_p += [eval_i]
+            for mod_i, mod_vars, eval_gcd in groups.values():
+                if p_i in mod_vars and mod_i.degree(p_i) > 0:
+                    eval_p = math.gcd(eval_p, eval_gcd)
                     mod_p += [mod_i]
-            eval_p = reduce(gcd, eval_p, 0)
             mod_p = reduce(gcd, mod_p, 0)
             if mod_p != p_i:
                 raise NotImplementedError
@@ -70,27 +97,46 @@ class AutomatedSolver(FullSolver):
 
         return soln
 
-    def _get_remaining_unknowns(
-        self, relations: RelationSet, solution: PartialSolution, bounds: BoundSet
-    ) -> SolutionSet:
+    def _get_remaining_problem(
+        self,
+        relations: RelationSet,
+        solution: PartialSolution,
+        bounds: BoundSet,
+        expected: SolutionSet,
+    ):
+        # Set up the problem in the variables not determined by SOLUTION.
+        # Returns the new problem, its expected solutions, and what is needed
+        # to lift its solutions back, or None if no unknowns remain.
         old_ring = relations.ring()
-        old_vars = [xi for xi in old_ring.gens() if xi not in solution]
+        old_gens = old_ring.gens()
+        old_gens_set = frozenset(old_gens)
+        old_vars = [xi for xi in old_gens if xi not in solution]
         if len(old_vars) == 0:
-            solns = SolutionSet([Solution(solution)])
-            if self.problem.check(solns):
-                return solns
-            else:
-                return SolutionSet()
+            return None
 
         new_varnames = ",".join([str(xi) for xi in old_vars])
         new_ring = PolynomialRing(ZZ, new_varnames)
-        varsubs = {old_xi: new_xi for old_xi, new_xi in zip(old_vars, new_ring.gens())}
-        varsubs.update(solution)
+        old_to_new = dict(zip(old_vars, new_ring.gens()))
+
+        # Substitute the known values, then move the remaining terms into the
+        # new ring by projecting their exponents onto the unknown variables
+        known = {xi: v for xi, v in solution.items() if xi in old_gens_set}
+        old_inds = [old_gens.index(xi) for xi in old_vars]
+        old_is_univariate = len(old_gens) == 1
+        new_is_univariate = len(old_vars) == 1
 
         new_rels = []
         for rel in relations:
-            new_poly = rel.polynomial.subs(varsubs)
-            new_poly = new_ring(str(new_poly))
+            new_terms = {}
+            for exp, coeff in rel.polynomial.subs(known).dict().items():
+                if old_is_univariate:
+                    exp = (exp,)
+                if new_is_univariate:
+                    new_exp = exp[old_inds[0]]
+                else:
+                    new_exp = tuple(exp[i] for i in old_inds)
+                new_terms[new_exp] = coeff
+            new_poly = new_ring(new_terms)
             if new_poly == 0:
                 continue
             if isinstance(rel.modulus, int):
@@ -100,79 +146,103 @@ class AutomatedSolver(FullSolver):
                     new_mod = rel.modulus.subs(solution)
                 else:
                     new_mod = None
-            new_rels += [Relation(new_poly, new_mod)]
-        new_relations = RelationSet(new_rels)
-
+            new_rels += [Relation._unchecked(new_poly, new_mod)]
+        if len(new_rels) == 0:
+            # Let the constructor report the empty problem
+            new_relations = RelationSet(new_rels)
+        else:
+            new_unknown_moduli = set()
+            for rel in new_rels:
+                new_unknown_moduli.update(rel.unknown_moduli())
+            new_relations = RelationSet._from_validated(
+                new_rels, new_ring, list(new_unknown_moduli)
+            )
+
+        # The bounds were validated when the original problem was built, so
+        # only rename the keys
         new_bounds = {}
+        new_abs_cache = {}
         for k, v in bounds.items():
             if k in solution:
                 continue
-            if k in varsubs:
-                new_bounds[varsubs[k]] = v
-            else:
-                new_bounds[k] = v
-        new_bounds = BoundSet(new_bounds)
+            new_k = old_to_new.get(k, k)
+            new_bounds[new_k] = v
+            new_abs_cache[new_k] = bounds._abs_cache[k]
+        new_bounds = BoundSet._from_validated(new_bounds, new_abs_cache)
 
         prob = MultivariateCoppersmithProblem(new_relations, new_bounds)
-        solver = AutomatedSolver(prob, *self.my_args, **self.my_kwargs)
-        if self.has_solution:
-            new_expected = []
-            for soln in self.expected:
-                # Convert from old ring to new ring
-                new_soln = {}
-                for xi in soln:
-                    if xi in old_ring.gens():
-                        if xi not in solution:
-                            new_soln[varsubs[xi]] = soln[xi]
-                    else:
-                        new_soln[xi] = soln[xi]
-                new_expected += [new_soln]
-            new_expected = SolutionSet(new_expected)
-            solver.set_expected(new_expected)
-
-        solns = []
-        new_solns = solver.solve()
-        for new_soln in new_solns:
-            # Convert from new ring to old ring
+        new_expected = None
+        if expected is not None:
+            # Convert from old ring to new ring, dropping the known variables
+            new_expected = SolutionSet(
+                [
+                    {
+                        old_to_new.get(xi, xi): v
+                        for xi, v in soln.items()
+                        if xi in old_to_new or xi not in old_gens_set
+                    }
+                    for soln in expected
+                ]
+            )
+        new_to_old = {new_xi: old_ring(new_xi) for new_xi in new_ring.gens()}
+        return prob, new_expected, (new_to_old, solution)
+
+    @staticmethod
+    def _lift_solution(soln, lifts) -> Solution:
+        # Convert a solution of a residual problem back to the original ring,
+        # innermost problem first
+        for new_to_old, solution in reversed(lifts):
             orig_soln = {}
-            for xi in new_soln:
-                if xi in new_ring.gens():
-                    orig_soln[old_ring(xi)] = new_soln[xi]
-                else:
-                    orig_soln[xi] = new_soln[xi]
+            for xi in soln:
+                orig_soln[new_to_old.get(xi, xi)] = soln[xi]
             orig_soln.update(solution)
-            solns += [orig_soln]
-        return [Solution(soln) for soln in solns]
+            soln = orig_soln
+        return Solution(soln)
 
-    def _expand_solution(
-        self,
-        partial_solns: PartialSolutionSet,
-        relations: RelationSet,
-        bounds: BoundSet,
-    ) -> SolutionSet:
-        solns = [
-            self._get_unknown_moduli(relations, partial_soln)
-            for partial_soln in partial_solns
+    def _get_partial_solutions(
+        self, prob: MultivariateCoppersmithProblem, expected: SolutionSet
+    ) -> PartialSolutionSet:
+        auto_partial_solver = AutomatedPartialSolver(
+            prob, *self.my_args, **self.my_kwargs
+        )
+        if expected is not None:
+            auto_partial_solver.set_expected(expected)
+        return auto_partial_solver.solve()
+
+    def solve(self) -> SolutionSet:
+        # Each partial solution may leave a smaller problem in the remaining
+        # unknowns. Work through these with an explicit stack rather than
+        # recursion, keeping solutions in depth-first order.
+        expected = self.expected if self.has_solution else None
+        partial_solns = self._get_partial_solutions(self.problem, expected)
+        stack = [
+            (self.problem, expected, partial_soln, [])
+            for partial_soln in reversed(partial_solns)
         ]
-        ext_solns = []
-        for soln in solns:
+
+        solns = []
+        while stack:
+            prob, expected, partial_soln, lifts = stack.pop()
+            relations = prob.relations
+            soln = self._get_unknown_moduli(relations, partial_soln)
             self.logger.info("Found partial solution")
             for xi, vi in soln.items():
                 self.logger.info("\t%s = %s", str(xi), str(vi))
-            ext_solns += self._get_remaining_unknowns(relations, soln, bounds)
-        return SolutionSet(ext_solns)
-
-    def solve(self) -> SolutionSet:
-        prob = self.problem
-
-        rels = prob.relations
 
-        auto_partial_solver = AutomatedPartialSolver(
-            self.problem, *self.my_args, **self.my_kwargs
-        )
-        if self.has_solution:
-            auto_partial_solver.set_expected(self.expected)
-        partial_solns = auto_partial_solver.solve()
+            remaining = self._get_remaining_problem(
+                relations, soln, prob.bounds, expected
+            )
+            if remaining is None:
+                full_soln = SolutionSet([Solution(soln)])
+                if prob.check(full_soln):
+                    solns += [self._lift_solution(soln, lifts)]
+                continue
 
-        solns = self._expand_solution(partial_solns, rels, prob.bounds)
-        return solns
+            new_prob, new_expected, lift = remaining
+            new_lifts = lifts + [lift]
+            new_partial_solns = self._get_partial_solutions(new_prob, new_expected)
+            stack += [
+                (new_prob, new_expected, new_partial_soln, new_lifts)
+                for new_partial_soln in reversed(new_partial_solns)
+            ]
+        return SolutionSet(solns)
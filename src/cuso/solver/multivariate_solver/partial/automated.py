@@ -1,5 +1,13 @@
 """This module implements automatically finding partial roots that solve Coppersmith problems."""
 
+from functools import cached_property
+import ctypes
+import multiprocessing
+from multiprocessing.connection import wait
+import os
+import signal
+import sys
+
 from cuso.exceptions import SolveFailureError
 from cuso.data.problem import MultivariateCoppersmithProblem
 from cuso.data.solutions import PartialSolutionSet
@@ -8,6 +16,51 @@ from .coppersmith import CoppersmithSolver
 from .groebner import GroebnerSolver
 from .linear import LinearSolver
 
+# prctl option that sends a signal to the calling process when its parent dies
+_PR_SET_PDEATHSIG = 1
+
+
+def _stop_process_group(signum, frame):  # pylint: disable=unused-argument
+    # SIGTERM handler of a worker: stop the worker and every process it started
+    os.killpg(os.getpgrp(), signal.SIGKILL)
+
+
+def _exit_with_parent(parent_pid):
+    # On Linux, deliver SIGTERM to this worker if the parent process dies, so
+    # a hard-killed parent does not leave workers and their children behind
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.prctl(_PR_SET_PDEATHSIG, signal.SIGTERM)
+    except (OSError, AttributeError):
+        return
+    if os.getppid() != parent_pid:
+        # The parent already died before the request was registered
+        os.kill(os.getpid(), signal.SIGTERM)
+
+
+def _run_solver(solver, conn, parent_pid):
+    # Entry point of a worker process racing one solver.
+    #
+    # The worker detaches into its own process group, and SIGTERM stops the
+    # whole group, so a flatter subprocess ends with its worker. Because of
+    # this, terminal signals such as Ctrl-C only reach the parent, which then
+    # terminates the workers. Without prctl (any platform but Linux), workers
+    # are not stopped if the parent is killed without running its cleanup.
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+        signal.signal(signal.SIGTERM, _stop_process_group)
+        _exit_with_parent(parent_pid)
+    try:
+        conn.send(("ok", solver.solve()))
+    except SolveFailureError:
+        conn.send(("fail", None))
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        conn.send(("error", exc))
+    finally:
+        conn.close()
+
 
 class AutomatedPartialSolver(PartialSolver):
     """Automatic recovery of partial roots in multivariate Coppersmith problems
@@ -18,12 +71,13 @@ class AutomatedPartialSolver(PartialSolver):
     Second, we try the Groebner solver, which uses Groebner bases to find the
     variety corresponding to relations with integer constraints. Third, we try
     the Coppersmith solver, which generates shift ideals and Coppersmith lattices.
+
+    If parallel solving is enabled, all solvers run at once in separate processes.
+    The result is the same as the sequential order: the first solver in the list
+    that succeeds wins, and the remaining solvers are terminated.
     """
 
-    linear_solver = None
     newton_solver = None
-    groebner_solver = None
-    coppersmith_solver = None
 
     def __init__(
         self,
@@ -32,27 +86,94 @@ class AutomatedPartialSolver(PartialSolver):
         use_intermediate_sizes=None,
         use_graph_optimization=None,
         use_primal_strategy=None,
+        enable_parallel=False,
     ):
         super().__init__(problem)
+        self.enable_parallel = enable_parallel
+        # The Coppersmith solver is only built once the other solvers have
+        # failed, so reject invalid options now rather than after they run
+        CoppersmithSolver.validate_options(problem, use_graph_optimization)
+        self._coppersmith_kwargs = {
+            "unraveled_linearization_relations": unraveled_linearization_relations,
+            "use_intermediate_sizes": use_intermediate_sizes,
+            "use_graph_optimization": use_graph_optimization,
+            "use_primal_strategy": use_primal_strategy,
+        }
+
+    # The solvers are only constructed once they are needed, since later
+    # solvers are skipped whenever an earlier one succeeds.
+    @cached_property
+    def linear_solver(self) -> LinearSolver:
+        return LinearSolver(self.problem)
+
+    @cached_property
+    def groebner_solver(self) -> GroebnerSolver:
+        return GroebnerSolver(self.problem)
+
+    @cached_property
+    def coppersmith_solver(self) -> CoppersmithSolver:
+        return CoppersmithSolver(self.problem, **self._coppersmith_kwargs)
 
-        self.linear_solver = LinearSolver(
-            problem,
-        )
-        self.groebner_solver = GroebnerSolver(
-            problem,
-        )
-        self.coppersmith_solver = CoppersmithSolver(
-            problem,
-            unraveled_linearization_relations=unraveled_linearization_relations,
-            use_intermediate_sizes=use_intermediate_sizes,
-            use_graph_optimization=use_graph_optimization,
-            use_primal_strategy=use_primal_strategy,
-        )
+    def _solve_parallel(self, solvers) -> PartialSolutionSet:
+        ctx = multiprocessing.get_context()
+        procs = []
+        conns = {}
+        for i, solver in enumerate(solvers):
+            if self.has_solution:
+                solver.set_expected(self.expected)
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            proc = ctx.Process(
+                target=_run_solver, args=(solver, send_conn, os.getpid())
+            )
+            proc.start()
+            send_conn.close()
+            procs += [proc]
+            conns[recv_conn] = i
+
+        results = [None] * len(solvers)
+        try:
+            while conns:
+                for conn in wait(list(conns)):
+                    i = conns.pop(conn)
+                    try:
+                        results[i] = conn.recv()
+                    except EOFError:
+                        # The worker died without reporting back, e.g. it
+                        # crashed or was killed for running out of memory
+                        procs[i].join()
+                        self.logger.warning(
+                            "%s worker exited unexpectedly with exit code %s",
+                            type(solvers[i]).__name__,
+                            procs[i].exitcode,
+                        )
+                        results[i] = ("fail", None)
+                    conn.close()
+
+                # Return the first result in priority order once it is decided
+                for result in results:
+                    if result is None:
+                        break
+                    status, value = result
+                    if status == "ok":
+                        return value
+                    if status == "error":
+                        raise value
+        finally:
+            for proc in procs:
+                if proc.is_alive():
+                    proc.terminate()
+                proc.join()
+        raise SolveFailureError("All multivariate solvers failed.")
 
     def solve(self) -> PartialSolutionSet:
-        solvers = [self.linear_solver, self.groebner_solver, self.coppersmith_solver]
+        solver_names = ["linear_solver", "groebner_solver", "coppersmith_solver"]
+        if self.enable_parallel:
+            return self._solve_parallel(
+                [getattr(self, name) for name in solver_names]
+            )
         # Try to solve using different methods
-        for solver in solvers:
+        for name in solver_names:
+            solver = getattr(self, name)
             try:
                 if self.has_solution:
                     solver.set_expected(self.expected)
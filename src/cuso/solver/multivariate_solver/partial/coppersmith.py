@@ -45,6 +45,10 @@ class CoppersmithSolver(PartialSolver):
     root_recovery_strategy: RootRecovery = None
     use_primal_strategy: bool = None
     use_graph_optimization: bool = None
+    # (modulus multiple known, has symbolic moduli), computed once
+    _configuration = None
+    # Result of running the problem converter on the problem, computed once
+    _converted = None
 
     def __init__(
         self,
@@ -86,10 +90,7 @@ class CoppersmithSolver(PartialSolver):
             use_intermediate_sizes=use_intermediate_sizes
         )
         if use_graph_optimization:
-            if not mod_mul_known:
-                raise ValueError(
-                    "Graph optimization requires a known multiple of the modulus"
-                )
+            self.validate_options(problem, use_graph_optimization, mod_mul_known)
             shift_poly_strategy = GraphShiftPolys(shift_poly_strategy)
         self.shift_poly_strategy = shift_poly_strategy
 
@@ -117,8 +118,13 @@ class CoppersmithSolver(PartialSolver):
 
         # Look for small coefficients.
         for rel in self.problem.relations:
-            coefs = rel.polynomial.coefficients()
-            num_small_coefs = len([c for c in coefs if abs(c) < 100])
+            # Stop counting as soon as a second small coefficient shows up
+            num_small_coefs = 0
+            for c in rel.polynomial.coefficients():
+                if abs(c) < 100:
+                    num_small_coefs += 1
+                    if num_small_coefs > 1:
+                        break
             if num_small_coefs > 1:
                 self.logger.info(
                     "Small coefficients detected, disabling graph optimization."
@@ -132,25 +138,55 @@ class CoppersmithSolver(PartialSolver):
         # It's probably OK to use the graph optimization
         return True
 
+    @classmethod
+    def validate_options(
+        cls,
+        problem: MultivariateCoppersmithProblem,
+        use_graph_optimization=None,
+        mod_mul_known=None,
+    ):
+        """Check that the solver options are compatible with the problem.
+
+        Args:
+            problem (MultivariateCoppersmithProblem): problem to solve
+            use_graph_optimization (bool, optional): requested graph optimization
+            mod_mul_known (bool, optional): whether a multiple of the modulus is
+                known. Computed from the problem if not given.
+
+        Raises:
+            ValueError: Graph optimization requires a known multiple of the modulus
+        """
+        if not use_graph_optimization:
+            return
+        if mod_mul_known is None:
+            mod_mul_known, _ = cls._compute_configuration(problem)
+        if not mod_mul_known:
+            raise ValueError(
+                "Graph optimization requires a known multiple of the modulus"
+            )
+
     def _get_configuration(self):
-        # Check if a multiple of the modulus is known
-        modulus_multiple_known = False
-        for rel in self.problem.relations:
-            if rel.modulus is not None:
-                if rel.polynomial.is_constant():
-                    # Constant polynomial with an unknown modulus
-                    modulus_multiple_known = True
-                    break
-                if isinstance(rel.modulus, int):
-                    # Known modulus
-                    modulus_multiple_known = True
-                    break
+        if self._configuration is None:
+            self._configuration = self._compute_configuration(self.problem)
+        return self._configuration
 
-        # Check if any of the relations have a symbolic modulus
+    @staticmethod
+    def _compute_configuration(problem: MultivariateCoppersmithProblem):
+        modulus_multiple_known = False
         has_symbolic_moduli = False
-        for rel in self.problem.relations:
-            if rel.modulus is not None and not isinstance(rel.modulus, int):
+        for rel in problem.relations:
+            if rel.modulus is None:
+                continue
+            if isinstance(rel.modulus, int):
+                # Known modulus
+                modulus_multiple_known = True
+            else:
                 has_symbolic_moduli = True
+                if not modulus_multiple_known and rel.polynomial.is_constant():
+                    # Constant polynomial with an unknown modulus
+                    modulus_multiple_known = True
+            if modulus_multiple_known and has_symbolic_moduli:
+                break
 
         return modulus_multiple_known, has_symbolic_moduli
 
@@ -174,7 +210,9 @@ class CoppersmithSolver(PartialSolver):
             num_modular,
             num_integer,
         )
-        new_prob, _, soln_converter = self.problem_converter.run(self.problem)
+        if self._converted is None:
+            self._converted = self.problem_converter.run(self.problem)
+        new_prob, _, soln_converter = self._converted
 
         if self.has_solution:
             _expected = soln_converter.convert_to_new(self.expected)
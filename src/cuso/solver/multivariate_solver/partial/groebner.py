@@ -45,25 +45,44 @@ class GroebnerSolver(PartialSolver):
         ring = polys[0].parent()
         if len(ring.gens()) == 1:
             # Univariate case
+            x = ring.gens()[0]
             # Get roots of first polynomial
             roots = [x_val for x_val, _ in polys[0].roots()]
 
-            # Check to see which roots satisfy all polynomials
-            roots = [root for root in roots if all(f(root) == 0 for f in polys)]
-            x = ring.gens()[0]
+            # Check to see which roots satisfy all other polynomials. A nonzero
+            # constant rules out every root; otherwise check the highest degrees
+            # first, since they are the most likely to reject a root.
+            others = [f for f in polys[1:] if f != 0]
+            if any(f.degree() == 0 for f in others):
+                roots = []
+            others = sorted(others, key=lambda f: -f.degree())
+            if len(roots) > 0 and len(others) > 0:
+                coeff_lists = [[int(c) for c in f.list()] for f in others]
+                max_deg = others[0].degree()
+                satisfying = []
+                for root in roots:
+                    # Share the powers of the root across all polynomials
+                    root = int(root)
+                    powers = [1] * (max_deg + 1)
+                    for k in range(1, max_deg + 1):
+                        powers[k] = powers[k - 1] * root
+                    if all(
+                        sum(c * p for c, p in zip(coeffs, powers)) == 0
+                        for coeffs in coeff_lists
+                    ):
+                        satisfying += [root]
+                roots = satisfying
             solns = [{x: root} for root in roots]
             return solns
         else:
             # See if there are any variables that don't appear in
             # the polynomials. If there are, add a dummy equation
             # to the ideal so we get a 0-dimensional variety.
-            unused_gens = []
-            for xi in ring.gens():
-                deg = max(f.degree(xi) for f in polys)
-                if deg == 0:
-                    unused_gens += [xi]
-            for xi in unused_gens:
-                polys += [xi]
+            used_gens = set()
+            for f in polys:
+                used_gens.update(f.variables())
+            unused_gens = [xi for xi in ring.gens() if xi not in used_gens]
+            polys += unused_gens
 
             ring_Q = ring.change_ring(QQ, order="degrevlex")
             ideal = ring_Q.ideal(polys)
@@ -73,25 +92,32 @@ class GroebnerSolver(PartialSolver):
                 # raise SolveFailureError("Positive dimension ideal.") from exc
                 # Positive dimension ideal
                 # Can we get any partial solutions from the GB?
-                gb = ideal.groebner_basis()
+                gb = list(ideal.groebner_basis())
+                # Propagate solved variables with a worklist: when a variable
+                # is solved, only the polynomials that contain it are
+                # substituted and checked again.
+                var_to_polys = {}
+                for i, g in enumerate(gb):
+                    for xi in g.variables():
+                        var_to_polys.setdefault(xi, []).append(i)
                 soln = {}
-                improved = True
-                while improved:
-                    improved = False
-                    for g in gb:
-                        g = g.subs(soln)
-                        if g == 0:
+                worklist = list(range(len(gb)))
+                while len(worklist) > 0:
+                    g = gb[worklist.pop()]
+                    if g == 0:
+                        continue
+                    if sum(g.degrees()) == 1:
+                        # Then this equation is a * x + b == 0, so we can solve for x
+                        (x,) = g.variables()
+                        if x in unused_gens:
                             continue
-                        if sum(g.degrees()) == 1:
-                            # Then this equation is a * x + b == 0, so we can solve for x
-                            (x,) = g.variables()
-                            if x in unused_gens:
-                                continue
-                            a = g.monomial_coefficient(x)
-                            b = g.constant_coefficient()
-                            val_x = int(-b // a)
-                            soln[x] = val_x
-                            improved = True
+                        a = g.monomial_coefficient(x)
+                        b = g.constant_coefficient()
+                        val_x = int(-b // a)
+                        soln[x] = val_x
+                        for i in var_to_polys.get(x, []):
+                            gb[i] = gb[i].subs({x: val_x})
+                            worklist += [i]
                 if len(soln) == 0:
                     # Unable to find any solutions
                     raise SolveFailureError("Positive dimension ideal.") from exc
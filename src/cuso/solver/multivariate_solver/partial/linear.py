@@ -1,8 +1,10 @@
 """Coppersmith solver for when input relations are linear."""
 
+from math import gcd, isqrt
 from typing import Tuple
 
-from sage.all import Infinity, lcm, sqrt, ceil
+import numpy as np
+from sage.all import Infinity
 from fpylll import IntegerMatrix
 from fpylll.fplll.gso import MatGSO
 from fpylll.fplll.enumeration import Enumeration, EnumerationError
@@ -34,26 +36,43 @@ class LinearSolver(PartialSolver):
     def _get_linear_relations(self, rels: RelationSet):
         """Get the subset of input relations that are linear"""
 
+        ring = rels.ring()
+        is_univariate = len(ring.gens()) == 1
         linear_rels = []
         for rel in rels:
             if rel.modulus is not None and not isinstance(rel.modulus, int):
                 # No symbolic moduli here
                 continue
-            if len(rel.polynomial.parent().gens()) == 1:
+            if is_univariate:
                 tot_degree = rel.polynomial.degree()
             else:
-                tot_degree = rel.polynomial.degree(std_grading=True)
+                # Standard total degree, regardless of the ring's term order
+                tot_degree = max(
+                    (sum(exp) for exp in rel.polynomial.dict()), default=-1
+                )
             if tot_degree <= 1:
                 linear_rels += [rel]
         if len(linear_rels) == 0:
             raise SolveFailureError("No linear relations")
-        rels = []
-        for rel in linear_rels:
-            if rel.modulus is None:
-                rels += [rel]
-            else:
-                rels += [Relation(rel.polynomial % rel.modulus, rel.modulus)]
-        return RelationSet(rels)
+        # Reducing the coefficients keeps the relations valid, and only
+        # integer moduli remain
+        rels = [
+            rel if rel.modulus is None else self._reduce_coefficients(rel)
+            for rel in linear_rels
+        ]
+        return RelationSet._from_validated(rels, ring, [])
+
+    @staticmethod
+    def _reduce_coefficients(rel: Relation) -> Relation:
+        # Reduce each coefficient modulo the integer modulus directly on the
+        # term dictionary, rather than through generic polynomial arithmetic
+        modulus = rel.modulus
+        terms = {}
+        for exp, coeff in rel.polynomial.dict().items():
+            coeff = int(coeff) % modulus
+            if coeff != 0:
+                terms[exp] = coeff
+        return Relation._unchecked(rel.polynomial.parent()(terms), modulus)
 
     def _build_lattice(self, rels: RelationSet, bounds: BoundSet) -> Lattice:
         builder = PrimalLatticeBuilder()
@@ -70,23 +89,26 @@ class LinearSolver(PartialSolver):
     ) -> PartialSolutionSet:
         """Look for all basis vectors with infinity norm <= 1"""
         short_inds = []
+        short_vecs = []
         denom = 1
         for i in range(lattice.rank()):
-            try:
-                vec = lattice.get_scaled_vector(i)
-            except ValueError:
+            if lattice.is_infinitely_large(i):
                 # Could happen if the lattice is scaled by Infinity
                 continue
+            vec = lattice.get_scaled_vector(i)
             if vec.norm(Infinity) <= 1:
                 short_inds += [i]
-                denom = lcm(denom, vec.denominator())
+                short_vecs += [vec]
+                # Keep the common denominator as a Python integer
+                vec_denom = int(vec.denominator())
+                denom = denom * vec_denom // gcd(denom, vec_denom)
         if len(short_inds) == 0:
             raise SolveFailureError("No sufficiently short vectors")
         if len(short_inds) == 1:
             vec = lattice.get_vector(short_inds[0])
             partial_soln = {}
-            if 1 in lattice.monomials:
-                one_ind = lattice.monomials.index(1)
+            one_ind = lattice.one_index
+            if one_ind is not None:
                 if vec[one_ind] == -1:
                     vec = tuple(-v_i for v_i in vec)
                 elif vec[one_ind] != 1:
@@ -100,43 +122,51 @@ class LinearSolver(PartialSolver):
         if len(short_inds) >= 2:
             # Use length of shortest vector to see if running the lattice enumerator
             # would return too many values to be useful
-            shvec = lattice.get_scaled_vector(short_inds[0])
+            shvec = short_vecs[0]
             shvec_len = shvec.norm(Infinity)
             if shvec_len < 1 / 100:
                 raise SolveFailureError("Too many candidate solutions")
 
-        A = IntegerMatrix(len(short_inds), len(lattice.monomials))
-        A_unscaled = IntegerMatrix(len(short_inds), len(lattice.monomials))
-        for i, ii in enumerate(short_inds):
-            vec = lattice.get_scaled_vector(ii)
-            vec_unscaled = lattice.get_vector(ii)
-            for j in range(len(lattice.monomials)):
-                A[i, j] = int(vec[j] * denom)
-                A_unscaled[i, j] = int(vec_unscaled[j])
+        # Fill the enumeration basis in a single call, reusing the scaled
+        # vectors found above
+        A = IntegerMatrix.from_matrix(
+            [[int(v_j * denom) for v_j in vec] for vec in short_vecs]
+        )
+        # Unscaled short vectors as Python integers, so candidates are
+        # combined exactly without going through fpylll
+        A_unscaled = np.array(
+            [[int(v_j) for v_j in lattice.get_vector(ii)] for ii in short_inds],
+            dtype=object,
+        )
         dim = len(lattice.monomials)
-        bound_len = int(ceil(denom * sqrt(dim)))
+        # ceil(denom * sqrt(dim)), computed exactly on integers
+        bound_sq = denom * denom * dim
+        bound_len = isqrt(bound_sq)
+        if bound_len * bound_len < bound_sq:
+            bound_len += 1
         M = MatGSO(A)
         M_mpfr = MatGSO(A, float_type="mpfr")
         _ = M.update_gso()
         M_mpfr.update_gso()
 
         partial_solns = []
+        one_ind = lattice.one_index
+        # Columns that hold the value of a variable
+        var_cols = [
+            (i, m_i) for i, m_i in enumerate(lattice.monomials) if i != one_ind
+        ]
 
         def callbackf(v):
             nonlocal partial_solns
-            v = tuple(round(v_i) for v_i in v)
-            vec = A_unscaled.multiply_left(v)
+            coeffs = np.array([round(v_i) for v_i in v], dtype=object)
+            vec = coeffs.dot(A_unscaled)
 
-            partial_soln = {}
-            if 1 in lattice.monomials:
-                one_ind = lattice.monomials.index(1)
+            if one_ind is not None:
                 if vec[one_ind] == -1:
-                    vec = tuple(-v_i for v_i in vec)
+                    vec = -vec
                 elif vec[one_ind] != 1:
                     return False
-            for i, m_i in enumerate(lattice.monomials):
-                if m_i != 1:
-                    partial_soln[m_i] = vec[i]
+            partial_soln = {m_i: vec[i] for i, m_i in var_cols}
             if not bounds.check(partial_soln):
                 return False
 
@@ -149,8 +179,8 @@ class LinearSolver(PartialSolver):
 
         enum = Enumeration(M, callbackf=callbackf)
         target = [0] * len(lattice.monomials)
-        if 1 in lattice.monomials:
-            target[lattice.monomials.index(1)] = int(denom)
+        if lattice.one_index is not None:
+            target[lattice.one_index] = int(denom)
         target = M_mpfr.from_canonical(target)
         exp = bound_len.bit_length()
         bound_len /= 1 << exp
@@ -3,13 +3,15 @@
 from typing import Iterator
 import functools
 import itertools
+import math
 from math import log2
 
+from gmpy2 import mpz, remove
 from sage.all import Integer, gcd, Expression
 
 from cuso.strategy.strategy import Strategy
 from cuso.data import RelationSet, BoundSet, RelationIdeal, Relation
-from cuso.utils import weighted_combinations
+from cuso.utils import weighted_combinations, coprime_base
 
 
 class RelationIdealGenerator(Strategy):
@@ -27,10 +29,23 @@ class RelationIdealGenerator(Strategy):
         self._J_ps = None
         self._J_inf = None
         self._ring = None
+        # Coprime factors of each set of moduli seen so far
+        self._factor_cache = {}
+        # Ideal of each multiplicity computed in the current run
+        self._ideal_cache = {}
+        # Each modular ideal with the exponent differences to combine it with
+        self._ideal_diffs = None
+        # Products of ideals computed in the current run, keyed by the
+        # operands' ids. The operands are kept alive with the result so that
+        # their ids are not reused.
+        self._prod_cache = {}
 
     def _get_list_of_factors(self, moduli):
         # Return list of pairwise coprime factors that divide all moduli
-        # It would be more efficient to use a product tree, but this is easier.
+        key = frozenset(moduli)
+        if key in self._factor_cache:
+            return list(self._factor_cache[key])
+
         factors = []
         if 0 in moduli:
             factors += [0]
@@ -50,30 +65,9 @@ class RelationIdealGenerator(Strategy):
                 int_part = mod.coefficients()[0][0]
                 modset += [int_part]
 
-        modset = list(set([mod for mod in modset if mod not in [0, 1]]))
-        while True:
-            # Check to see if all pairs have 0 gcd
-            inds_shared_factor = None
-            for i, mod_i in enumerate(modset):
-                for j, mod_j in enumerate(modset):
-                    if j <= i:
-                        continue
-                    if gcd(mod_i, mod_j) != 1:
-                        inds_shared_factor = i, j
-                        break
-            if inds_shared_factor is None:
-                break
-
-            i, j = inds_shared_factor
-            g = int(gcd(modset[i], modset[j]))
-            new_modset = [g, modset[i] // g, modset[j] // g]
-            new_modset += [
-                m_i for i, m_i in enumerate(modset) if i not in inds_shared_factor
-            ]
-            new_modset = self._get_list_of_factors(new_modset)
-            modset = new_modset
-
-        return modset + factors
+        factors = coprime_base(modset) + factors
+        self._factor_cache[key] = factors
+        return list(factors)
 
     def _get_base_ideals(self, relations, ring):
         # Cancel out any shared factors in the moduli
@@ -82,9 +76,17 @@ class RelationIdealGenerator(Strategy):
             if rel.modulus is None:
                 new_rels += [rel]
             else:
-                g = functools.reduce(
-                    gcd, rel.polynomial.coefficients() + [rel.modulus], 0
-                )
+                if isinstance(rel.modulus, int):
+                    # Stop as soon as the content is known to be trivial
+                    g = abs(rel.modulus)
+                    for c in rel.polynomial.coefficients():
+                        g = math.gcd(g, int(c))
+                        if g == 1:
+                            break
+                else:
+                    g = functools.reduce(
+                        gcd, rel.polynomial.coefficients() + [rel.modulus], 0
+                    )
                 if g == 1:
                     new_rels += [rel]
                 else:
@@ -103,8 +105,14 @@ class RelationIdealGenerator(Strategy):
         exponents = []
         for mod in moduli:
             exponent = [0] * len(factors)
+            is_int_mod = isinstance(mod, int)
+            if is_int_mod:
+                mod = mpz(mod)
             for j, q_j in enumerate(factors):
-                if isinstance(q_j, int):
+                if is_int_mod and isinstance(q_j, int) and q_j > 1:
+                    # Divide out every power of the factor in a single call
+                    mod, exponent[j] = remove(mod, q_j)
+                elif isinstance(q_j, int):
                     while mod % q_j == 0:
                         # The modulus is divisible by this factor
                         mod //= q_j
@@ -149,28 +157,15 @@ class RelationIdealGenerator(Strategy):
         }
         return factors, J_ps, J_inf
 
-    @functools.lru_cache()
-    def _get_ideal(self, multiplicity):
-        if min(multiplicity) < 0:
-            # Invalid ideal
-            return None
-
-        if sum(multiplicity) == 0:
-            return RelationIdeal([1], self._ring, 1)
-
-        J = self._J_inf
-
+    def _get_ideal_terms(self, multiplicity):
         # For each of the ideals J1 in mod_rels, see if there's a previous
         # ideal J2 such that the modulus of J1 * J2 is a multiple of the
-        # modulus of J and J2 is "smaller" than this multiplicity
-        mod_ideals = self._J_ps
-        for exp, ideal1 in mod_ideals.items():
-            diffgen = itertools.product(*[range(d + 1) for d in exp])
+        # modulus of J and J2 is "smaller" than this multiplicity.
+        # Returns the pairs (J1, multiplicity of J2).
+        terms = []
+        for exp, ideal1, diffs in self._ideal_diffs:
             applied_diffs = []
-            for diff in diffgen:
-                if diff == exp:
-                    continue
-
+            for diff in diffs:
                 is_dominated = False
                 for applied_diff in applied_diffs:
                     # Check to see if the applied_diff dominates this diff.
@@ -183,15 +178,56 @@ class RelationIdealGenerator(Strategy):
                 exp_smaller = tuple(
                     ai - bi + di for ai, bi, di in zip(multiplicity, exp, diff)
                 )
-                ideal2 = self._get_ideal(exp_smaller)
-                if ideal2 is None:
+                if min(exp_smaller) < 0:
+                    # Invalid ideal
                     continue
 
                 applied_diffs += [diff]
-                J = J + ideal1 * ideal2
+                terms += [(ideal1, exp_smaller)]
+        return terms
 
-        self.logger.debug("Generated ideal for multiplicity %s", multiplicity)
-        return J
+    def _mul_ideals(self, ideal1, ideal2):
+        key = (id(ideal1), id(ideal2))
+        if key not in self._prod_cache:
+            self._prod_cache[key] = (ideal1, ideal2, ideal1 * ideal2)
+        return self._prod_cache[key][2]
+
+    def _get_ideal(self, multiplicity):
+        if min(multiplicity) < 0:
+            # Invalid ideal
+            return None
+
+        # Every term has a strictly smaller multiplicity, so fill the cache
+        # with an explicit stack, computing an ideal once all its terms are known
+        cache = self._ideal_cache
+        pending = {}
+        stack = [multiplicity]
+        while stack:
+            mult = stack[-1]
+            if mult in cache:
+                stack.pop()
+                continue
+            if sum(mult) == 0:
+                cache[mult] = RelationIdeal([1], self._ring, 1)
+                stack.pop()
+                continue
+
+            if mult not in pending:
+                pending[mult] = self._get_ideal_terms(mult)
+            terms = pending[mult]
+            missing = [mult2 for _, mult2 in terms if mult2 not in cache]
+            if len(missing) > 0:
+                stack += missing
+                continue
+
+            J = self._J_inf
+            for ideal1, mult2 in terms:
+                J = J + self._mul_ideals(ideal1, cache[mult2])
+            cache[mult] = J
+            del pending[mult]
+            stack.pop()
+            self.logger.debug("Generated ideal for multiplicity %s", mult)
+        return cache[multiplicity]
 
     def run(self, relations: RelationSet, bounds: BoundSet) -> Iterator[RelationIdeal]:
         """Generate relation ideals for input relations.
@@ -212,6 +248,21 @@ class RelationIdealGenerator(Strategy):
         self._J_ps = J_ps
         self._J_inf = J_inf
         self._ring = J_inf.ring()
+        self._ideal_cache = {}
+        self._prod_cache = {}
+        # The candidate differences only depend on each ideal's exponent
+        self._ideal_diffs = [
+            (
+                exp,
+                ideal1,
+                [
+                    diff
+                    for diff in itertools.product(*[range(d + 1) for d in exp])
+                    if diff != exp
+                ],
+            )
+            for exp, ideal1 in J_ps.items()
+        ]
 
         if len(J_ps) == 0:
             # Only have integer relations.
@@ -22,10 +22,9 @@ class DualLatticeBuilder(LatticeBuilder):
         if not all(rel.modulus == modulus for rel in relations):
             raise ValueError("All shift relations must share the same modulus")
 
-        monomials = []
-        for rel in relations:
-            monomials += rel.polynomial.monomials()
-        monomials = sorted(list(set(monomials)))
+        monomials = relations.monomials()
+        # Map each monomial's exponent to its column
+        exp_to_col = {m.exponents()[0]: j for j, m in enumerate(monomials)}
 
         rank = len(relations)
         dimension = len(monomials)
@@ -33,19 +32,17 @@ class DualLatticeBuilder(LatticeBuilder):
             "Building lattice of rank %d and dimension %d", rank, dimension
         )
 
-        M = Matrix(ZZ, rank, dimension)
+        # Collect the nonzero entries first, then build the dense matrix in
+        # one call rather than assigning entries one at a time
+        entries = {}
         for i, rel in enumerate(relations):
             f = rel.polynomial
-            for m in f.monomials():
-                j = monomials.index(m)
-                cij = f.monomial_coefficient(m)
-                M[i, j] = cij
+            for exp, cij in f.dict().items():
+                entries[i, exp_to_col[exp]] = cij
+        M = Matrix(ZZ, rank, dimension, entries, sparse=False)
 
         # scale
-        scale_factors = []
-        for m in monomials:
-            Xj = bounds.get_abs_bound(m)
-            scale_factors += [Xj]
+        scale_factors = bounds.get_monomial_abs_bounds(monomials)
 
         L = Lattice(
             M, monomials, modulus=modulus, scale_factors=scale_factors, is_primal=False
@@ -15,10 +15,9 @@ class PrimalLatticeBuilder(LatticeBuilder):
         if not isinstance(bounds, BoundSet):
             raise TypeError("LatticeBuilder requires BoundSet as input")
 
-        monomials = []
-        for rel in relations:
-            monomials += rel.polynomial.monomials()
-        monomials = sorted(list(set(monomials)))
+        monomials = relations.monomials()
+        # Map each monomial's exponent to its row
+        exp_to_row = {m.exponents()[0]: i for i, m in enumerate(monomials)}
 
         # Get number of relations with a modular constraint
         num_mod_rels = 0
@@ -37,28 +36,27 @@ class PrimalLatticeBuilder(LatticeBuilder):
             "Building lattice of rank %d and dimension %d", rank, dimension
         )
 
-        M = Matrix(ZZ, rank, dimension)
-
+        # Collect the nonzero entries first, then build the dense matrix in
+        # one call rather than assigning entries one at a time
+        entries = {}
         for i in range(rank):
-            M[i, i] = 1
+            entries[i, i] = 1
 
         mod_rel_ind = 0
         for j, rel in enumerate(relations):
             # Column num_monoms + j encodes this relation
             f = rel.polynomial
-            for m in f.monomials():
-                i = monomials.index(m)
-                cij = f.monomial_coefficient(m)
-                M[i, num_monoms + j] = cij
+            for exp, cij in f.dict().items():
+                entries[exp_to_row[exp], num_monoms + j] = cij
             if rel.modulus is not None:
                 # Add the modulus to the lower right corner
-                M[num_monoms + mod_rel_ind, num_monoms + j] = rel.modulus
+                entries[num_monoms + mod_rel_ind, num_monoms + j] = rel.modulus
                 mod_rel_ind += 1
+        M = Matrix(ZZ, rank, dimension, entries, sparse=False)
 
         # scale
         scale_factors = []
-        for m in monomials:
-            Xj = bounds.get_abs_bound(m)
+        for Xj in bounds.get_monomial_abs_bounds(monomials):
             scale_factors += [1 / QQ(Xj)]
         scale_factors += [Infinity] * len(relations)
 
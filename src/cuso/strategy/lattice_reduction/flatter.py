@@ -1,14 +1,33 @@
 """Wrapper around flatter's lattice reduction methods"""
 
+from functools import lru_cache
 from shutil import which
 from subprocess import Popen, PIPE
 import warnings
 
+from fpylll import IntegerMatrix, LLL
 from sage.all import Matrix, ZZ
 
 from .lattice_reduction import LatticeReduction
 
 
+# Whether the missing flatter warning has been shown
+_warned_missing_flatter = False
+
+
+@lru_cache(maxsize=None)
+def _flatter_path():
+    # Resolve the flatter executable once rather than searching PATH per lattice
+    return which("flatter")
+
+
+def _fpylll_reduce(basis: Matrix) -> Matrix:
+    # LLL-reduce with fpylll's native implementation
+    A = IntegerMatrix.from_matrix(basis)
+    LLL.reduction(A)
+    return Matrix(ZZ, A.nrows, A.ncols, [list(row) for row in A])
+
+
 class Flatter(LatticeReduction):
     """Strategy that uses flatter's fast lattice reduction method."""
 
@@ -21,7 +40,14 @@ class Flatter(LatticeReduction):
         Returns:
             str: string representation
         """
-        row_s = ["[" + " ".join([hex(c) for c in row]) + "]" for row in basis.rows()]
+        # Convert all entries in one pass over the flat entry list instead of
+        # building a vector object per row
+        ncols = basis.ncols()
+        entries = list(map(hex, basis.list()))
+        row_s = [
+            "[" + " ".join(entries[i : i + ncols]) + "]"
+            for i in range(0, len(entries), ncols)
+        ]
         rep = "[" + "\n".join(row_s) + "\n]\n"
         return rep
 
@@ -38,9 +64,12 @@ class Flatter(LatticeReduction):
         assert rows[-1] == ""
         assert rows[-2] == "]"
         rows = rows[:-2]
-        rows = [row.lstrip("[").rstrip("]") for row in rows]
-        rows = [[int(s) for s in row.split(" ")] for row in rows]
-        return Matrix(ZZ, rows)
+        nrows = len(rows)
+        # Parse every entry with a single split and fill the matrix from the
+        # flat list
+        entries = " ".join(rows).replace("[", " ").replace("]", " ").split()
+        ncols = len(entries) // nrows if nrows > 0 else 0
+        return Matrix(ZZ, nrows, ncols, [int(s) for s in entries])
 
     def reduce_integer_basis(self, basis: Matrix) -> Matrix:
         """Perform lattice basis reduction on an integer matrix.
@@ -51,17 +80,21 @@ class Flatter(LatticeReduction):
         Returns:
             Matrix: reduced basis
         """
-        if which("flatter") is None:
-            warnings.warn(
-                "flatter is not installed, using Sage instead. "
-                "Please install https://github.com/keeganryan/flatter for faster lattice reduction",
-                UserWarning
-            )
-            return basis.LLL()
+        global _warned_missing_flatter  # pylint: disable=global-statement
+        flatter_path = _flatter_path()
+        if flatter_path is None:
+            if not _warned_missing_flatter:
+                _warned_missing_flatter = True
+                warnings.warn(
+                    "flatter is not installed, using fpylll instead. "
+                    "Please install https://github.com/keeganryan/flatter for faster lattice reduction",
+                    UserWarning
+                )
+            return _fpylll_reduce(basis)
 
         lat_s = self.lattice_to_str(basis)
 
-        proc = Popen("flatter", stdin=PIPE, stdout=PIPE)
+        proc = Popen(flatter_path, stdin=PIPE, stdout=PIPE)
         outs, _ = proc.communicate(lat_s.encode())
         red_basis = self.lattice_from_str(outs.decode())
         self.logger.info("Reduced lattice basis using flatter")
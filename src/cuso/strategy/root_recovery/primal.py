@@ -33,11 +33,10 @@ class PrimalRecovery(RootRecovery):
         # Look for vectors with infinity norm <= 1
         short_inds = []
         for i in range(lattice.rank()):
-            try:
-                vec = lattice.get_scaled_vector(i)
-            except ValueError:
+            if lattice.is_infinitely_large(i):
                 # Could happen if the lattice is scaled by Infinity
                 continue
+            vec = lattice.get_scaled_vector(i)
             if vec.norm(Infinity) <= 1:
                 short_inds += [i]
         return short_inds
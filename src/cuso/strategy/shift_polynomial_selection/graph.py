@@ -6,7 +6,7 @@ import math
 import igraph as ig
 
 from cuso.data import BoundSet, RelationSet, Relation
-from cuso.utils import is_suitable
+from cuso.utils import approx_log_shvec_bound, is_suitable
 
 from .shift_poly_selection import ShiftPolyStrategy
 
@@ -19,8 +19,7 @@ class GraphShiftPolys(ShiftPolyStrategy):
         self.sub_shift_polys: ShiftPolyStrategy = sub_shift_polys
 
     def _approx_shvec_bound(self, shift_polys, bounds: BoundSet):
-        logdet = sum(math.log2(bounds.get_abs_bound(f.lt())) for f in shift_polys)
-        return logdet / len(shift_polys)
+        return approx_log_shvec_bound(shift_polys, bounds)
 
     def _maximum_closure(self, G):
         # Use Picard's algorithm to find maximum closure
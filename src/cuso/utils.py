@@ -2,7 +2,11 @@
 
 from typing import Iterator, Tuple, List
 from heapq import heappush, heappop
+import math
 
+from sage.all import gcd
+
+from cuso.data import BoundSet
 from cuso.data.types import Polynomial
 
 
@@ -36,6 +40,58 @@ def weighted_combinations(weights: Tuple[float]) -> Iterator[Tuple[List[int], fl
         yield exps, score
 
 
+def coprime_base(values: List[int]) -> List[int]:
+    """Return a coprime base for a list of integers.
+
+    The result is a list of pairwise coprime integers greater than 1 such
+    that every input is a product of powers of them, up to sign. Each new
+    value is only split against the base elements it shares a factor with,
+    rather than restarting the pairwise search after every split.
+
+    Args:
+        values (List[int]): integers to factor over a common base
+
+    Returns:
+        List[int]: pairwise coprime base
+    """
+    base = []
+    worklist = [v for v in set(values) if v not in [0, 1]]
+    while worklist:
+        a = worklist.pop()
+        a_is_int = isinstance(a, int)
+        for i, b in enumerate(base):
+            # Python integers skip Sage's generic gcd dispatch
+            if a_is_int and isinstance(b, int):
+                g = math.gcd(a, b)
+            else:
+                g = int(gcd(a, b))
+            if g != 1:
+                # Replace b by the pieces of a and b, which are refined in turn
+                del base[i]
+                worklist += [v for v in [g, a // g, b // g] if v not in [0, 1]]
+                break
+        else:
+            base += [a]
+    return base
+
+
+def approx_log_shvec_bound(polys: List[Polynomial], bounds: BoundSet) -> float:
+    """Estimate the length of the shortest vector of a shift polynomial lattice.
+
+    For (M, <)-suitable shift polynomials, the basis is triangular, so the
+    determinant is the product of the bounded leading terms.
+
+    Args:
+        polys (List[Polynomial]): suitable shift polynomials
+        bounds (BoundSet): bounds on the variables
+
+    Returns:
+        float: log2 of the expected shortest vector length
+    """
+    logdet = sum(math.log2(bounds.get_abs_bound(f.lt())) for f in polys)
+    return logdet / len(polys)
+
+
 def is_suitable(polys: List[Polynomial]) -> bool:
     """Checks whether a set of polynomials is suitable.
 
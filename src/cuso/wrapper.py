@@ -477,6 +477,7 @@ def find_small_roots(
     use_intermediate_sizes: bool = True,
     allow_partial_solutions: bool = False,
     expected_solution: Optional[SolutionSetLike] = None,
+    enable_parallel: bool = False,
 ) -> List[Dict]:
     """Find bounded roots of a system of polynomial equations.
 
@@ -524,6 +525,9 @@ def find_small_roots(
             provide the intended root to ensure that intermediate results are computed
             correctly. This value can be a dictionary mapping variables to their value,
             a list of dictionaries, or a cuso SolutionSet.
+        enable_parallel (bool): If True, run the linear, Groebner, and Coppersmith
+            solvers concurrently in separate processes instead of one after another.
+            The result is the same, but uses more cores. Defaults to False.
 
     Returns:
         List[Dict]: A list of bounded solutions of the input polynomials, represented
@@ -551,6 +555,7 @@ def find_small_roots(
         unraveled_linearization_relations=ul_rels,
         use_intermediate_sizes=use_intermediate_sizes,
         use_graph_optimization=use_graph_optimization,
+        enable_parallel=enable_parallel,
     )
     if expected:
         solver.set_expected(expected)
@@ -0,0 +1,39 @@
+import warnings
+
+import pytest
+
+pytest.importorskip("sage.all")
+pytest.importorskip("fpylll")
+
+from sage.all import Matrix, ZZ  # noqa: E402
+
+from cuso.strategy.lattice_reduction import flatter  # noqa: E402
+
+
+def test_reduce_without_flatter_matches_sage_lll(monkeypatch):
+    monkeypatch.setattr(flatter, "_flatter_path", lambda: None)
+    monkeypatch.setattr(flatter, "_warned_missing_flatter", False)
+    basis = Matrix(
+        ZZ,
+        [
+            [1, 0, 0, 12345],
+            [0, 1, 0, 23456],
+            [0, 0, 1, 34567],
+            [0, 0, 0, 100003],
+        ],
+    )
+
+    with pytest.warns(UserWarning, match="flatter is not installed"):
+        reduced = flatter.Flatter().reduce_integer_basis(basis)
+    expected = basis.LLL()
+
+    assert reduced.dimensions() == expected.dimensions()
+    assert reduced.row_module() == basis.row_module()
+    assert sorted(row.norm() for row in reduced.rows()) == sorted(
+        row.norm() for row in expected.rows()
+    )
+
+    # The missing flatter warning is only shown once
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        flatter.Flatter().reduce_integer_basis(basis)